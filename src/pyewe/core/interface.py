@@ -61,8 +61,15 @@ class CoreInterface:
             with redirect_stdout(null):
                 ret = self._core.LoadModel(path)
 
+        self._clear_scenario_indices()
+        self._state.scenario_changed()
         return ret
 
+    def _clear_scenario_indices(self):
+        """Invalidate the scenario name caches of the model managers."""
+        self.Ecosim._clear_scenario_index()
+        self.Ecotracer._clear_scenario_index()
+
     def get_country(self) -> str:
         """Get the country that the model is based on."""
         return self._core.get_EwEModel().get_Country()
@@ -221,7 +228,10 @@ class CoreInterface:
         self.results = XarrayCSV(save_dir)
 
     def close_model(self):
-        return self._core.CloseModel()
+        ret = self._core.CloseModel()
+        self._clear_scenario_indices()
+        self._state.scenario_changed()
+        return ret
 
     def print_summary(self):
         """Print summary on the state of the EwE core."""
@@ -1,6 +1,6 @@
 from abc import abstractmethod
+from contextlib import contextmanager
 import numpy as np
-from math import isnan
 from typing import Union
 from warnings import warn
 
@@ -24,12 +24,15 @@ def _generate_group_getter(param_container_name: str, name: str):
             first argument.
     """
 
-    def getter(self: EwEScenarioModel):
-        self._assert_scenario_loaded()
-        return [
-            getattr(getattr(self._core, param_container_name)(i), name)()
-            for i in range(1, self._core.nGroups + 1)
-        ]
+    def getter(self: EwEScenarioModel) -> np.ndarray:
+        if not self._skip_assert:
+            self._assert_scenario_loaded()
+        n_groups = self._core.nGroups
+        container_fn = getattr(self._core, param_container_name)
+        out = np.empty(n_groups, dtype=np.float64)
+        for i in range(n_groups):
+            out[i] = getattr(container_fn(i + 1), name)()
+        return out
 
     # For Debugging
     getter.__name__ = f"set_{param_container_name}_{name}"
@@ -48,7 +51,8 @@ def _generate_group_setter(param_container_name, name):
     """
 
     def setter(self: EwEScenarioModel, values, idxs=None):
-        self._assert_scenario_loaded()
+        if not self._skip_assert:
+            self._assert_scenario_loaded()
         if idxs is None:
             self._assert_setter_list_length(list(values))
         else:
@@ -79,7 +83,8 @@ def _generate_env_getter(param_container_name: str, name: str):
     """
 
     def getter(self: EwEScenarioModel):
-        self._assert_scenario_loaded()
+        if not self._skip_assert:
+            self._assert_scenario_loaded()
         param_container = getattr(self._core, param_container_name)()
         return getattr(param_container, name)()
 
@@ -99,7 +104,8 @@ def _generate_env_setter(param_container_name: str, name: str):
     """
 
     def setter(self: EwEScenarioModel, value):
-        self._assert_scenario_loaded()
+        if not self._skip_assert:
+            self._assert_scenario_loaded()
         param_container = getattr(self._core, param_container_name)()
         return getattr(param_container, name)(value)
 
@@ -119,39 +125,35 @@ class EwEParameterManager:
     accessed by and should map to the getters and setters find in the container object. See
     the definition of Ecotracer or Ecosim managers. The Container names should be a string
     that matches the name of the Parameter contained in the cCore object in the EwE
-    binaries.
+    binaries. A subclass may define its own get_<name> or set_<name> method, in which case
+    no accessor is generated for it.
     """
 
     def __init_subclass__(cls):
-
-        group_param_container_name = getattr(cls, "_GROUP_PARAM_CONTAINER_NAME")
-        group_param_names = getattr(cls, "_GROUP_PARAM_NAMES")
-        env_param_container_name = getattr(cls, "_ENV_PARAM_CONTAINER_NAME")
-        env_param_names = getattr(cls, "_ENV_PARAM_NAMES")
-
-        for param_name, (getter_name, setter_name) in group_param_names.items():
-            setattr(
-                cls,
-                f"get_{param_name}",
-                _generate_group_getter(group_param_container_name, getter_name),
-            )
-            setattr(
-                cls,
-                f"set_{param_name}",
-                _generate_group_setter(group_param_container_name, setter_name),
-            )
-
-        for param_name, (getter_name, setter_name) in env_param_names.items():
-            setattr(
-                cls,
-                f"get_{param_name}",
-                _generate_env_getter(env_param_container_name, getter_name),
-            )
-            setattr(
-                cls,
-                f"set_{param_name}",
-                _generate_env_setter(env_param_container_name, setter_name),
-            )
+        group_container = cls._GROUP_PARAM_CONTAINER_NAME
+        env_container = cls._ENV_PARAM_CONTAINER_NAME
+
+        # Methods defined directly on the subclass take precedence over generated ones.
+        defined = cls.__dict__
+        for param_name, (getter_name, setter_name) in cls._GROUP_PARAM_NAMES.items():
+            get_name = f"get_{param_name}"
+            set_name = f"set_{param_name}"
+            if get_name not in defined:
+                setattr(
+                    cls, get_name, _generate_group_getter(group_container, getter_name)
+                )
+            if set_name not in defined:
+                setattr(
+                    cls, set_name, _generate_group_setter(group_container, setter_name)
+                )
+
+        for param_name, (getter_name, setter_name) in cls._ENV_PARAM_NAMES.items():
+            get_name = f"get_{param_name}"
+            set_name = f"set_{param_name}"
+            if get_name not in defined:
+                setattr(cls, get_name, _generate_env_getter(env_container, getter_name))
+            if set_name not in defined:
+                setattr(cls, set_name, _generate_env_setter(env_container, setter_name))
 
 
 class EwEModel:
@@ -166,6 +168,10 @@ class EwEScenarioModel(EwEModel):
 
     def __init__(self, core, state):
         super().__init__(core, state)
+        # Lazily built map of scenario name to one-based index, see _scenario_index.
+        self._name_index_cache = None
+        # Set within scenario_asserted() to skip per-call scenario checks.
+        self._skip_assert = False
 
     @abstractmethod
     def scenario_count(self) -> int:
@@ -192,18 +198,53 @@ class EwEScenarioModel(EwEModel):
         """Check that a scenario is loaded. Throw error is not loaded."""
         pass
 
+    @contextmanager
+    def scenario_asserted(self):
+        """Check once that a scenario is loaded and skip the check inside the block.
+
+        Generated parameter getters and setters normally check that a scenario is loaded on
+        every call. Within this context the check is made once on entry, which avoids
+        repeated round trips to the core when many parameters are accessed in a row. The
+        scenario must not be closed or changed inside the block.
+        """
+        self._assert_scenario_loaded()
+        prev = self._skip_assert
+        self._skip_assert = True
+        try:
+            yield self
+        finally:
+            self._skip_assert = prev
+
     def _assert_setter_list_length(self, property: list):
         if len(property) != self._core.nGroups:
             msg = f"Expected list of length {self._core.nGroups} "
             msg += f"but received {len(property)}"
             raise EcopathError(self._state, msg)
 
+    def _scenario_index(self, name: str) -> int:
+        """Get the one-based index of the scenario with the given name.
+
+        Scenario names are read from the core once and cached until the set of scenarios
+        changes. If several scenarios share a name, the first is used.
+        """
+        if self._name_index_cache is None:
+            cache = {}
+            for index in range(1, self.scenario_count() + 1):
+                cache.setdefault(self._get_scenario(index).Name, index)
+            self._name_index_cache = cache
+
+        index = self._name_index_cache.get(name)
+        if index is None:
+            raise LookupError(f"Unable to find scenario named: {name}")
+        return index
+
+    def _clear_scenario_index(self) -> None:
+        """Invalidate the cached scenario name to index map."""
+        self._name_index_cache = None
+
     def _load_named_scenario(self, name: str) -> bool:
         """Load a scenario with the given name."""
-        for index in range(1, self.scenario_count() + 1):
-            if self._get_scenario(index).Name == name:
-                return self._load_scenario(index)
-        raise LookupError(f"Unable to find scenario named: {name}")
+        return self._load_scenario(self._scenario_index(name))
 
     def _load_indexed_scenario(self, index: int) -> bool:
         """Load a scenario for the given one-based index."""
@@ -227,12 +268,15 @@ class EwEScenarioModel(EwEModel):
             TypeError: The provided identifier was not a string or integer.
         """
         if isinstance(identifier, str):
-            return self._load_named_scenario(identifier)
+            loaded = self._load_named_scenario(identifier)
         elif isinstance(identifier, int):
-            return self._load_indexed_scenario(identifier)
+            loaded = self._load_indexed_scenario(identifier)
         else:
             raise TypeError(f"Unsupported type: {type(identifier)}")
 
+        self._state.scenario_changed()
+        return loaded
+
     @abstractmethod
     def new_scenario(
         self, name: str, description: str, author: str, contact: str
@@ -257,10 +301,7 @@ class EwEScenarioModel(EwEModel):
 
     def _remove_named_scenario(self, name: str) -> bool:
         """Load a scenario with the given name."""
-        for index in range(1, self.scenario_count() + 1):
-            if self._get_scenario(index).Name == name:
-                return self._remove_scenario(index)
-        raise LookupError(f"Unable to find scenario named: {name}")
+        return self._remove_scenario(self._scenario_index(name))
 
     def _remove_indexed_scenario(self, index: int) -> bool:
         """Load a scenario for the given one-based index."""
@@ -284,12 +325,16 @@ class EwEScenarioModel(EwEModel):
             TypeError: The provided identifier was not a string or integer.
         """
         if isinstance(identifier, str):
-            return self._remove_named_scenario(identifier)
+            removed = self._remove_named_scenario(identifier)
         elif isinstance(identifier, int):
-            return self._remove_indexed_scenario(identifier)
+            removed = self._remove_indexed_scenario(identifier)
         else:
             raise TypeError(f"Unsupported type: {type(identifier)}")
 
+        self._clear_scenario_index()
+        self._state.scenario_changed()
+        return removed
+
     @abstractmethod
     def run(self) -> bool:
         """Run the model."""
@@ -353,7 +398,10 @@ class EcosimStateManager(EwEScenarioModel, EwEParameterManager):
 
     def new_scenario(self, name: str, description: str, author: str, contact: str):
         """Create a new Ecosim scenario."""
-        return self._core.NewEcosimScenario(name, description, author, contact)
+        created = self._core.NewEcosimScenario(name, description, author, contact)
+        self._clear_scenario_index()
+        self._state.scenario_changed()
+        return created
 
     def save_scenario(self):
         """Save the current state of the ecosim scenario to the underlying database."""
@@ -363,10 +411,15 @@ class EcosimStateManager(EwEScenarioModel, EwEParameterManager):
     def save_scenario_as(self, name: str, description: str):
         """Save the current state of the ecosim scenario to a new scenario."""
         self._assert_scenario_loaded()
-        return self._core.SaveEcosimScenarioAs(name, description)
+        saved = self._core.SaveEcosimScenarioAs(name, description)
+        self._clear_scenario_index()
+        self._state.scenario_changed()
+        return saved
 
     def close_scenario(self):
-        return self._core.CloseEcosimScenario()
+        closed = self._core.CloseEcosimScenario()
+        self._state.scenario_changed()
+        return closed
 
     def run(self):
         """Run the ecosim model without ecotracer and return whether it was successful."""
@@ -390,14 +443,28 @@ class EcosimStateManager(EwEScenarioModel, EwEParameterManager):
 
     def set_vulnerabilities(self, vulnerabilities: np.ndarray):
         """Set ecosim vulnerabilites from a vulnerability matrix."""
+        if not self._skip_assert:
+            self._assert_scenario_loaded()
+
         # Assume correct shape is checked before hand.
-        for prey_idx in range(1, self._core.nGroups + 1):
-            prey_ecosim_input = self._core.get_EcosimGroupInputs(prey_idx)
-            for pred_idx, val in enumerate(vulnerabilities[prey_idx - 1, :]):
-                if isnan(val):
-                    continue
+        vulnerabilities = np.asarray(vulnerabilities, dtype=np.float64)
+        vulnerabilities = vulnerabilities[: self._core.nGroups]
+
+        # Locate all non-nan cells at once, in row-major order so entries for the same
+        # prey are contiguous.
+        prey_idxs, pred_idxs = np.nonzero(~np.isnan(vulnerabilities))
+        vals = vulnerabilities[prey_idxs, pred_idxs]
+
+        current_prey = -1
+        prey_ecosim_input = None
+        for prey_idx, pred_idx, val in zip(
+            prey_idxs.tolist(), pred_idxs.tolist(), vals.tolist()
+        ):
+            if prey_idx != current_prey:
+                prey_ecosim_input = self._core.get_EcosimGroupInputs(prey_idx + 1)
+                current_prey = prey_idx
 
-                prey_ecosim_input.set_VulMult(pred_idx + 1, val)
+            prey_ecosim_input.set_VulMult(pred_idx + 1, val)
 
 
 class EcotracerStateManager(EwEScenarioModel, EwEParameterManager):
@@ -453,7 +520,10 @@ class EcotracerStateManager(EwEScenarioModel, EwEParameterManager):
 
     def new_scenario(self, name: str, description: str, author: str, contact: str):
         """Create a new EcoTracer scenario."""
-        return self._core.NewEcotracerScenario(name, description, author, contact)
+        created = self._core.NewEcotracerScenario(name, description, author, contact)
+        self._clear_scenario_index()
+        self._state.scenario_changed()
+        return created
 
     def save_scenario(self):
         """Save the state of the ecotracer scenario to the underlying database."""
@@ -463,7 +533,10 @@ class EcotracerStateManager(EwEScenarioModel, EwEParameterManager):
     def save_scenario_as(self, name: str, description: str):
         """Save the state of the ecotracer scenario to the underlying database."""
         self._assert_scenario_loaded()
-        return self._core.SaveEcotracerScenario(name, description)
+        saved = self._core.SaveEcotracerScenario(name, description)
+        self._clear_scenario_index()
+        self._state.scenario_changed()
+        return saved
 
     def set_contaminant_forcing_number(self, forcing_index: int) -> None:
         """Set the index of the contaminant forcing function.
@@ -493,7 +566,9 @@ class EcotracerStateManager(EwEScenarioModel, EwEParameterManager):
         return self._core.get_EcotracerModelParameters().get_ConForceNumber()
 
     def close_scenario(self):
-        return self._core.CloseEcotracerScenario()
+        closed = self._core.CloseEcotracerScenario()
+        self._state.scenario_changed()
+        return closed
 
     def run(self) -> bool:
         """Run the ecosim model with ecotracer and return whether it was successful"""
@@ -35,13 +35,18 @@ def initialise(ewe_binary_dir: str) -> None:
     _ewe_util_module = import_module("EwEUtils")
 
 
+# The binaries are only loaded when first needed, so importing the package stays cheap.
 _bin_dir = os.getenv("EWE_BIN_PATH")
 if _bin_dir is None:
     msg = "Unable to find environmental variable 'EWE_BIN_PATH'. "
     msg += "Call 'initialise' to setup module."
     warn(msg)
-else:
-    initialise(_bin_dir)
+
+
+def _initialise_from_env() -> None:
+    """Initialise from 'EWE_BIN_PATH' on first use if not yet initialised."""
+    if _ewe_core_module is None and _bin_dir is not None:
+        initialise(_bin_dir)
 
 
 def get_ewe_bin_path() -> str:
@@ -54,6 +59,7 @@ def get_ewe_bin_path() -> str:
 def get_ewe_core_module():
     """Get the EwE Core module."""
     global _ewe_core_module
+    _initialise_from_env()
     if _ewe_core_module is None:
         raise RuntimeError("EwE Core module not initialised. Call initialise().")
 
@@ -63,6 +69,7 @@ def get_ewe_core_module():
 def get_ewe_util_module():
     """Get the EwE Util module."""
     global _ewe_util_module
+    _initialise_from_env()
     if _ewe_util_module is None:
         raise RuntimeError("EwE Util module not initialised. Call initialise().")
 
@@ -70,13 +77,15 @@ def get_ewe_util_module():
 
 
 _ewe_ecosim_res_types = None
+_ewe_ecosim_res_type_enum = None
 
 
 def initialise_ecosim_result_types():
     """Initialise global dictionary that maps between ecosim result types names and the enum"""
-    global _ewe_ecosim_res_types
+    global _ewe_ecosim_res_types, _ewe_ecosim_res_type_enum
 
     type_enum = get_ewe_core_module().Ecosim.cEcosimResultWriter.eResultTypes
+    _ewe_ecosim_res_type_enum = type_enum
     _ewe_ecosim_res_types = {
         "Biomass": type_enum.Biomass,
         "ConsumptionBiomass": type_enum.ConsumptionBiomass,
@@ -99,21 +108,23 @@ def initialise_ecosim_result_types():
     }
 
 
-def get_ecosim_result_type_enum(type_name: str):
-    """Convert a ecosim result type name to the visual basic enumeration"""
-    global _ewe_ecosim_res_types
-
+def _ensure_result_types():
+    """Get the result type enumeration and the name to enum table, initialising once."""
     if _ewe_ecosim_res_types is None:
         initialise_ecosim_result_types()
 
-    return _ewe_ecosim_res_types[type_name]
+    return _ewe_ecosim_res_type_enum, _ewe_ecosim_res_types
 
 
-def result_type_enum_array(type_names: Iterable[str]):
-    core_module = get_ewe_core_module()
+def get_ecosim_result_type_enum(type_name: str):
+    """Convert a ecosim result type name to the visual basic enumeration"""
+    _, res_types = _ensure_result_types()
+    return res_types[type_name]
 
-    el_type = core_module.Ecosim.cEcosimResultWriter.eResultTypes
-    return Array[el_type]([get_ecosim_result_type_enum(nm) for nm in type_names])
+
+def result_type_enum_array(type_names: Iterable[str]):
+    el_type, res_types = _ensure_result_types()
+    return Array[el_type]([res_types[nm] for nm in type_names])
 
 
 def py_bool_to_ewe_tristate(flag: bool):
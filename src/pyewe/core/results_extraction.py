@@ -4,6 +4,7 @@
 import numpy as np
 import clr, System
 import ctypes
+from operator import attrgetter
 from System.Reflection import BindingFlags
 from System import Array, Int32
 from System.Runtime.InteropServices import GCHandle, GCHandleType
@@ -40,6 +41,21 @@ _MAP_NET_NP = {
 }
 
 
+class _Pin:
+    """Context manager pinning a CLR array and yielding the address of its data."""
+
+    __slots__ = ("_handle",)
+
+    def __init__(self, netArray):
+        self._handle = GCHandle.Alloc(netArray, GCHandleType.Pinned)
+
+    def __enter__(self) -> int:
+        return self._handle.AddrOfPinnedObject().ToInt64()
+
+    def __exit__(self, *exc_info):
+        self._handle.Free()
+
+
 def intoNumpyArray(netArray, buffer):
     """
     Given a CLR `System.Array` and a `numpy.ndarray`, copy CLR `System.Array` into
@@ -54,14 +70,9 @@ def intoNumpyArray(netArray, buffer):
         msg += f"into a numpy.ndarray of shape {buffer.shape}"
         raise RuntimeError(msg)
 
-    try:  # Memmove
-        sourceHandle = GCHandle.Alloc(netArray, GCHandleType.Pinned)
-        sourcePtr = sourceHandle.AddrOfPinnedObject().ToInt64()
+    with _Pin(netArray) as sourcePtr:
         destPtr = buffer.__array_interface__["data"][0]
         ctypes.memmove(destPtr, sourcePtr, buffer.nbytes)
-    finally:
-        if sourceHandle.IsAllocated:
-            sourceHandle.Free()
     return buffer
 
 
@@ -81,14 +92,9 @@ def asNumpyArray(netArray):
             "asNumpyArray does not yet support System type {}".format(netType)
         )
 
-    try:  # Memmove
-        sourceHandle = GCHandle.Alloc(netArray, GCHandleType.Pinned)
-        sourcePtr = sourceHandle.AddrOfPinnedObject().ToInt64()
+    with _Pin(netArray) as sourcePtr:
         destPtr = npArray.__array_interface__["data"][0]
         ctypes.memmove(destPtr, sourcePtr, npArray.nbytes)
-    finally:
-        if sourceHandle.IsAllocated:
-            sourceHandle.Free()
     return npArray
 
 
@@ -101,16 +107,20 @@ class DropEnum:
     KEEP_LAST: int = 3
 
 
-def get_drop_slice(drop_flag: int):
-    """Constuct the array slice given the drop flag."""
-    if drop_flag == DropEnum.DROP_NONE:
-        return slice(None, None)
-    elif drop_flag == DropEnum.DROP_FIRST:
-        return slice(1, None)
-    elif drop_flag == DropEnum.DROP_LAST:
-        return slice(None, -1)
-    elif drop_flag == DropEnum.KEEP_LAST:
-        return -1
+# Index expressions for each DropEnum flag, built once at import.
+_DROP_SLICES = (slice(None, None), slice(1, None), slice(None, -1), -1)
+
+
+def get_drop_slice(drop_flag):
+    """Constuct the array slice given the drop flag.
+
+    Index expressions from _DROP_SLICES are passed through unchanged so callers may
+    supply them directly.
+    """
+    if isinstance(drop_flag, slice) or drop_flag == _DROP_SLICES[DropEnum.KEEP_LAST]:
+        return drop_flag
+    if isinstance(drop_flag, int) and 0 <= drop_flag < len(_DROP_SLICES):
+        return _DROP_SLICES[drop_flag]
     raise ValueError(f"Drop flag {drop_flag} is not valid.")
 
 
@@ -123,11 +133,12 @@ class ResultStoreEnum:
 
     @staticmethod
     def is_valid(private_field_name: str) -> bool:
-        return private_field_name in [
-            ResultStoreEnum.ECOPATH,
-            ResultStoreEnum.ECOSIM,
-            ResultStoreEnum.ECOTRACER,
-        ]
+        return private_field_name in _VALID_RESULT_STORES
+
+
+_VALID_RESULT_STORES = frozenset(
+    {ResultStoreEnum.ECOPATH, ResultStoreEnum.ECOSIM, ResultStoreEnum.ECOTRACER}
+)
 
 
 class ResultExtractor:
@@ -142,8 +153,25 @@ class ResultExtractor:
         _private_field: name of the non-public field to access.
         _array_name: name of the array in the non-public field.
         _drop_flags: indicating whether to drop the first or last slice of each dimension
+        _container: cached value of the non-public field, reset by invalidate().
+        _warm: whether the run state has been checked since the last invalidate().
     """
 
+    __slots__ = (
+        "_core",
+        "_monitor",
+        "_private_field",
+        "_array_name",
+        "_buffer",
+        "_buffer_ptr",
+        "_private_field_info",
+        "_container",
+        "_array_getter",
+        "_drop_flags",
+        "_warm",
+        "__weakref__",  # the monitor holds a weak reference to invalidate()
+    )
+
     def __init__(
         self,
         core,
@@ -152,24 +180,35 @@ class ResultExtractor:
         array_name: str,
         drop_flags: Optional[tuple] = None,
     ):
+        if not ResultStoreEnum.is_valid(private_field):
+            raise ValueError(f"{private_field} is not a valid non-public field name.")
+
         self._core = core
         self._monitor = monitor
         self._private_field = private_field
         self._array_name = array_name
         self._buffer = None
+        self._buffer_ptr = None
 
         flags = BindingFlags.Instance | BindingFlags.NonPublic
         obj_type = self._core.GetType()
         self._private_field_info = obj_type.GetField(private_field, flags)
 
-        self._drop_flags = tuple(get_drop_slice(fl) for fl in drop_flags)
+        # The result container held in the private field is resolved via reflection on
+        # first use and reused until the monitor reports a model or scenario change.
+        self._container = None
+        self._array_getter = attrgetter(array_name)
+        # Set once the run state has been checked, reset by invalidate().
+        self._warm = False
+        self._monitor.register_scenario_callback(self.invalidate)
+
+        self._drop_flags = (
+            None
+            if drop_flags is None
+            else tuple(get_drop_slice(fl) for fl in drop_flags)
+        )
 
     def _has_run_check(self):
-        if not ResultStoreEnum.is_valid(self._private_field):
-            raise ValueError(
-                f"{self._private_field} is not a valid non-public field name."
-            )
-
         if not self._monitor.HasEcopathRan():
             raise EcopathError(
                 self._monitor, "Ecopath must be run before accessing results."
@@ -183,16 +222,55 @@ class ResultExtractor:
                 self._monitor, "Ecotracer must be run before accessing results."
             )
 
+    def invalidate(self):
+        """Drop cached state so the next refresh re-checks the run and field access."""
+        self._container = None
+        self._warm = False
+
     def _get_dot_net_array(self):
-        return getattr(self._private_field_info.GetValue(self._core), self._array_name)
+        if self._container is None:
+            self._container = self._private_field_info.GetValue(self._core)
+        return self._array_getter(self._container)
 
     def refresh_buffer(self):
-        self._has_run_check()
+        # Once a run has been confirmed the models cannot become un-run until the model
+        # or a scenario changes, at which point the monitor calls invalidate().
+        if not self._warm:
+            self._has_run_check()
+            self._warm = True
+        self._copy_into_buffer()
+
+    def _set_buffer(self, buffer: np.ndarray):
+        self._buffer = buffer
+        self._buffer_ptr = buffer.__array_interface__["data"][0]
+
+    def _copy_into_buffer(self):
+        net_arr = self._get_dot_net_array()
         if self._buffer is None:
             # allocate and write buffer
-            self._buffer = asNumpyArray(self._get_dot_net_array())
+            self._set_buffer(asNumpyArray(net_arr))
+        elif self._matches_buffer_shape(net_arr):
+            # The dtype was validated when the buffer was allocated, so later refreshes
+            # only need to confirm the shape before copying.
+            with _Pin(net_arr) as sourcePtr:
+                ctypes.memmove(self._buffer_ptr, sourcePtr, self._buffer.nbytes)
+        else:
+            # Fall back to the full check to report the shape mismatch.
+            intoNumpyArray(net_arr, self._buffer)
+
+    def _matches_buffer_shape(self, net_arr) -> bool:
+        """Check the .NET array has the same rank and length in every dimension."""
+        shape = self._buffer.shape
+        if net_arr.Rank != len(shape):
+            return False
+        return all(net_arr.GetLength(dim) == n for dim, n in enumerate(shape))
+
+    def _copy_from(self, source: np.ndarray):
+        """Fill the buffer from another extractor's buffer of the same .NET array."""
+        if self._buffer is None:
+            self._set_buffer(source.copy())
         else:
-            intoNumpyArray(self._get_dot_net_array(), self._buffer)
+            np.copyto(self._buffer, source)
 
     def _get_buffer(self):
         if self._buffer is None:
@@ -203,6 +281,34 @@ class ResultExtractor:
         return self._buffer
 
 
+def refresh_many(extractors) -> None:
+    """Refresh the buffers of several extractors in a single pass.
+
+    The run state is checked once for each distinct monitor and each .NET array is pinned
+    and copied once. Extractors reading an array that has already been copied in this pass
+    take a numpy copy of the first extractor's buffer instead.
+
+    Arguments:
+        extractors (Iterable[ResultExtractor]): Extractors to refresh.
+    """
+    checked_monitors = set()
+    copied = {}
+    for extractor in extractors:
+        if not extractor._warm:
+            if id(extractor._monitor) not in checked_monitors:
+                extractor._has_run_check()
+                checked_monitors.add(id(extractor._monitor))
+            extractor._warm = True
+
+        key = (id(extractor._core), extractor._private_field, extractor._array_name)
+        source = copied.get(key)
+        if source is None:
+            extractor._copy_into_buffer()
+            copied[key] = extractor._buffer
+        else:
+            extractor._copy_from(source)
+
+
 class SingleResultsExtractor(ResultExtractor):
     """A result extraction class that handles the extraction of a single variable.
 
@@ -213,6 +319,8 @@ class SingleResultsExtractor(ResultExtractor):
         _drop_flags: Indicating which slices of the raw dot net array to drop.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         core,
@@ -225,6 +333,8 @@ class SingleResultsExtractor(ResultExtractor):
 
     def get_result(self):
         """Get the numpy.ndarray containing the results."""
+        if self._drop_flags is None:
+            return self._get_buffer()
         return self._get_buffer()[self._drop_flags]
 
 
@@ -241,8 +351,11 @@ class PackedResultsExtractor(ResultExtractor):
         _array_name: name of the array in the private_field to access.
         _drop_flags: Indicating which slices of the raw dot net array to drop.
         _variable_map: Map from variable name to index mirroring the enumeration in EwE.
+        _slices: Map from variable name to the full index into the buffer.
     """
 
+    __slots__ = ("_variable_map", "_slices")
+
     def __init__(
         self,
         core,
@@ -255,13 +368,14 @@ class PackedResultsExtractor(ResultExtractor):
         super().__init__(core, monitor, private_field, array_name, drop_flags)
         self._variable_map = variable_map
 
+        drop_slices = () if self._drop_flags is None else self._drop_flags
+        self._slices = {
+            name: (idx, *drop_slices) for name, idx in variable_map.items()
+        }
+
     def get_result(self, variable_name: str):
         """Get the numpy.ndarray containing the results of the given variable."""
-        if self._drop_flags is None:
-            return self._get_buffer()[self._variable_map[variable_name]]
-        else:
-            slices = (self._variable_map[variable_name], *self._drop_flags)
-            return self._get_buffer()[slices]
+        return self._get_buffer()[self._slices[variable_name]]
 
 
 def create_ecosim_group_stats_extractors(core, monitor):
@@ -289,7 +403,7 @@ def create_ecosim_group_stats_extractors(core, monitor):
             "TL": 14,
         },
         # See cEcosimResultWriter.vb, array copy starts from 1 in on a 0-indexed array.
-        (DropEnum.DROP_FIRST, DropEnum.DROP_FIRST),
+        (_DROP_SLICES[DropEnum.DROP_FIRST], _DROP_SLICES[DropEnum.DROP_FIRST]),
     )
 
 
@@ -301,7 +415,7 @@ def create_conc_end_extractor(core, monitor):
         ResultStoreEnum.ECOTRACER,
         "TracerConc",
         # See cEcotracerRusultWriter, array copy start from 0 for group and 1 for time.
-        (DropEnum.DROP_LAST, DropEnum.KEEP_LAST),
+        (_DROP_SLICES[DropEnum.DROP_LAST], _DROP_SLICES[DropEnum.KEEP_LAST]),
     )
 
 
@@ -313,7 +427,7 @@ def create_conc_extractor(core, monitor):
         ResultStoreEnum.ECOTRACER,
         "TracerConc",
         # See cEcotracerRusultWriter, array copy start from 0 for group and 1 for time.
-        (DropEnum.DROP_LAST, DropEnum.DROP_FIRST),
+        (_DROP_SLICES[DropEnum.DROP_LAST], _DROP_SLICES[DropEnum.DROP_FIRST]),
     )
 
 
@@ -324,7 +438,7 @@ def create_conc_biomass_extractor(core, monitor):
         monitor,
         ResultStoreEnum.ECOTRACER,
         "TracerCB",
-        (DropEnum.DROP_LAST, DropEnum.DROP_FIRST),
+        (_DROP_SLICES[DropEnum.DROP_LAST], _DROP_SLICES[DropEnum.DROP_FIRST]),
     )
 
 
@@ -335,7 +449,7 @@ def create_TL_catch_extractor(core, monitor):
         monitor,
         ResultStoreEnum.ECOSIM,
         "TLC",
-        (DropEnum.DROP_LAST,),
+        (_DROP_SLICES[DropEnum.DROP_LAST],),
     )
 
 
@@ -346,7 +460,7 @@ def create_FIB_extractor(core, monitor):
         monitor,
         ResultStoreEnum.ECOSIM,
         "FIB",
-        (DropEnum.DROP_LAST,),
+        (_DROP_SLICES[DropEnum.DROP_LAST],),
     )
 
 
@@ -357,7 +471,7 @@ def create_Kemptons_extractor(core, monitor):
         monitor,
         ResultStoreEnum.ECOSIM,
         "Kemptons",
-        (DropEnum.DROP_FIRST,),
+        (_DROP_SLICES[DropEnum.DROP_FIRST],),
     )
 
 
@@ -368,5 +482,5 @@ def create_shannon_diversity_extractor(core, monitor):
         monitor,
         ResultStoreEnum.ECOSIM,
         "ShannonDiversity",
-        (DropEnum.DROP_LAST,),
+        (_DROP_SLICES[DropEnum.DROP_LAST],),
     )
@@ -1,3 +1,4 @@
+import weakref
 from functools import partial
 
 
@@ -9,6 +10,7 @@ class EwEState:
 
     def __init__(self, core):
         self._monitor = core.StateMonitor
+        self._scenario_callbacks = []
 
         # Auto-add monitor methods
         for method_name in dir(self._monitor):
@@ -21,6 +23,29 @@ class EwEState:
                         self, method_name, partial(getattr(self._monitor, method_name))
                     )
 
+    def register_scenario_callback(self, callback) -> None:
+        """Register a bound method to be called when the loaded model or scenario changes.
+
+        Only a weak reference to the method is kept, so registering does not extend the
+        lifetime of the owning object. References to collected objects are dropped here
+        as well as on notification, so repeatedly creating extractors does not grow the
+        list between scenario changes.
+        """
+        self._scenario_callbacks = [
+            ref for ref in self._scenario_callbacks if ref() is not None
+        ]
+        self._scenario_callbacks.append(weakref.WeakMethod(callback))
+
+    def scenario_changed(self) -> None:
+        """Notify registered objects that the loaded model or scenario has changed."""
+        alive = []
+        for ref in self._scenario_callbacks:
+            callback = ref()
+            if callback is not None:
+                callback()
+                alive.append(ref)
+        self._scenario_callbacks = alive
+
     # This is the quick and dirty way of reflecting methods from StateMonitor.
     # It works, but reduces discoverability (e.g., tab-completion does not work)
     # def __getattr__(self, name):
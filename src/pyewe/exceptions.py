@@ -1,10 +1,17 @@
+from functools import cached_property
+
+
 class EwEError(Exception):
 
     def __init__(self, core_state, message):
-        self._core_summary = core_state.non_model_summary()
+        self._core_state = core_state
         self.message = message
         super().__init__(message)
 
+    @cached_property
+    def _core_summary(self):
+        return self._core_state.non_model_summary()
+
     def get_state(self):
         return self._core_summary
 
@@ -16,17 +23,23 @@ class EcopathError(EwEError):
 
     def __init__(self, core_state, message):
         self.message = message
-        self._model_summary = core_state.ecosim_summary()
         super().__init__(core_state, message)
 
+    @cached_property
+    def _model_summary(self):
+        return self._core_state.ecosim_summary()
+
 
 class EcosimError(EwEError):
 
     def __init__(self, core_state, message):
         self.message = message
-        self._model_summary = core_state.ecosim_summary()
         super().__init__(core_state, message)
 
+    @cached_property
+    def _model_summary(self):
+        return self._core_state.ecosim_summary()
+
     def __str__(self):
         return f"{self.message} \n\n{self._model_summary}"
 
@@ -35,9 +48,12 @@ class EcotracerError(EwEError):
 
     def __init__(self, core_state, message):
         self.message = message
-        self._model_summary = core_state.ecotracer_summary()
         super().__init__(core_state, message)
 
+    @cached_property
+    def _model_summary(self):
+        return self._core_state.ecotracer_summary()
+
     def __str__(self):
         return f"{self.message} \n\n{super().get_state()}\n{self._model_summary}"
 
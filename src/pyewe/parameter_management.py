@@ -1,6 +1,8 @@
-from typing import Union, Dict, List
+from typing import Union, Dict, List, Sequence
 from math import nan
 
+import numpy as np
+
 from pyewe import CoreInterface
 
 
@@ -39,6 +41,16 @@ class Parameter:
             parameter is an environmental parameter,this will be -1.
     """
 
+    __slots__ = (
+        "name",
+        "param_type",
+        "value",
+        "df_idx",
+        "is_env_param",
+        "category_idx",
+        "group_idx",
+    )
+
     def __init__(
         self,
         name: str,
@@ -67,6 +79,11 @@ class Parameter:
         self.param_type = ParameterType.VARIABLE
         self.df_idx = df_idx
 
+    def unset(self) -> None:
+        self.param_type = ParameterType.UNSET
+        self.value = nan
+        self.df_idx = -1
+
     @property
     def is_set(self) -> bool:
         return self.param_type != ParameterType.UNSET
@@ -97,17 +114,45 @@ class ParameterManager:
         """Initialize parameter manager with functional group names"""
         self.fg_names = fg_names
         self.params: Dict[str, Parameter] = {}
-        self._variable_params_processed = False
 
         self._fg_param_prefixes = fg_param_prefixes
         self._fg_param_to_setters = fg_param_to_setters
         self._env_param_names = env_param_names
+        self._env_param_names_set = frozenset(env_param_names)
         self._env_param_to_setter = env_param_to_setters
         self._initialize_params()
 
         self._variable_fg_indices = [[] for _ in range(len(fg_param_prefixes))]
         self._variable_fg_df_indices = [[] for _ in range(len(fg_param_prefixes))]
         self._variable_env_params = []
+        self._variable_fg_buffers = []
+
+        # Variable setters resolved against the core they were last applied to.
+        self._bound_core = None
+        self._variable_fg_setters = []
+        self._variable_env_setters = []
+
+        # Constant values partitioned by category, kept up to date as constants are set.
+        self._constant_fg_values = [[] for _ in range(len(fg_param_prefixes))]
+        self._constant_fg_group_indices = [[] for _ in range(len(fg_param_prefixes))]
+        self._constant_env_params: Dict[int, float] = {}
+
+        # Constant setters and their arguments, rebuilt when constants or the core change.
+        self._constant_bound_core = None
+        self._constant_setters = []
+
+    def reset(self) -> None:
+        """Unset all parameters, keeping the parameter objects and name lookups."""
+        for param in self.params.values():
+            param.unset()
+
+        n_cats = len(self._fg_param_prefixes)
+        self._constant_fg_values = [[] for _ in range(n_cats)]
+        self._constant_fg_group_indices = [[] for _ in range(n_cats)]
+        self._constant_env_params = {}
+        self._constant_bound_core = None
+        self._constant_setters = []
+        self._process_variable_params()
 
     @staticmethod
     def EcotracerManager(core):
@@ -159,28 +204,44 @@ class ParameterManager:
         Create a list of parameter objects based on the list of known functional group names
         and parameters prefixes. Includes environmental parameters.
         """
+        # n_chars padding the index in the name so the naming
+        # in alphabetical order follows the order of the ecopath model.
+        n_chars = len(str(len(self.fg_names)))
+
+        # The index and group name part of the name is shared by every prefix
+        suffixes = [
+            self._format_param_suffix(i, n_chars, fg_name)
+            for i, fg_name in enumerate(self.fg_names, 1)
+        ]
+
         # Create functional group parameters
-        for prefix in self._fg_param_prefixes:
-            for i, fg_name in enumerate(self.fg_names, 1):
-                # n_chars padding the index in the name so the naming
-                # in alphabetical order follows the order of the ecopath model.
-                n_chars = len(str(len(self.fg_names)))
-                param_name = self._format_param_name(prefix, i, n_chars, fg_name)
-                cat_idx = self._fg_param_prefixes.index(prefix)
+        self._fg_names_by_prefix: Dict[str, List[str]] = {}
+        for cat_idx, prefix in enumerate(self._fg_param_prefixes):
+            prefix_names = self._fg_names_by_prefix.setdefault(prefix, [])
+            for i, suffix in enumerate(suffixes, 1):
+                param_name = f"{prefix}_{suffix}"
                 param = Parameter(param_name, cat_idx, False, i)
                 self.params[param_name] = param
+                prefix_names.append(param_name)
 
         # Create environmental parameters
-        for env_param in self._env_param_names:
-            cat_idx = self._env_param_names.index(env_param)
+        for cat_idx, env_param in enumerate(self._env_param_names):
             param = Parameter(env_param, cat_idx, True)
             self.params[env_param] = param
 
+        # No parameters are added after initialisation
+        self._all_param_names = tuple(self.params)
+
+    @staticmethod
+    def _format_param_suffix(index: int, n_chars: int, name: str) -> str:
+        """Format the padded index and group name part of a parameter name"""
+        idx_str = str(index).rjust(n_chars, "0")
+        return f"{idx_str}_{name}"
+
     @staticmethod
     def _format_param_name(prefix: str, index: int, n_chars: int, name: str) -> str:
         """Format functional group parameter names"""
-        idx_str = str(index).rjust(n_chars, "0")
-        return f"{prefix}_{idx_str}_{name}"
+        return f"{prefix}_{ParameterManager._format_param_suffix(index, n_chars, name)}"
 
     @staticmethod
     def format_param_names(
@@ -203,7 +264,7 @@ class ParameterManager:
 
     def get_all_param_names(self) -> List[str]:
         """Get list of all parameter names"""
-        return list(self.params.keys())
+        return list(self._all_param_names)
 
     def get_fg_param_names(
         self, param_prefixes: Union[str, List[str]] = "all"
@@ -224,11 +285,9 @@ class ParameterManager:
 
         names = []
         for prefix in param_prefixes:
-            if prefix not in self._fg_param_prefixes:
+            if prefix not in self._fg_names_by_prefix:
                 raise ValueError(f"Invalid parameter prefix: {prefix}")
-            names.extend(
-                [name for name in self.params.keys() if name.startswith(prefix + "_")]
-            )
+            names.extend(self._fg_names_by_prefix[prefix])
         return names
 
     def set_constant_params(
@@ -240,10 +299,47 @@ class ParameterManager:
         the parameter manager. This function does NOT write the value into the core EwE
         instance.
         """
+        variables_changed = False
         for name, value in zip(param_names, param_values):
             if name not in self.params:
                 raise ValueError(f"Unknown parameter: {name}")
-            self.params[name].set_as_constant(value)
+            param = self.params[name]
+            prev_type = param.param_type
+            param.set_as_constant(value)
+            self._store_constant(param, prev_type == ParameterType.CONSTANT)
+            self._constant_bound_core = None
+
+            if prev_type == ParameterType.VARIABLE:
+                variables_changed = True
+
+        if variables_changed:
+            self._process_variable_params()
+
+    def _store_constant(self, param: Parameter, replace: bool) -> None:
+        """Record a constant parameter's value in the per-category constant tables."""
+        if param.is_env_param:
+            self._constant_env_params[param.category_idx] = param.value
+            return
+
+        values = self._constant_fg_values[param.category_idx]
+        group_indices = self._constant_fg_group_indices[param.category_idx]
+        if replace:
+            values[group_indices.index(param.group_idx)] = param.value
+        else:
+            values.append(param.value)
+            group_indices.append(param.group_idx)
+
+    def _discard_constant(self, param: Parameter) -> None:
+        """Remove a parameter from the per-category constant tables."""
+        if param.is_env_param:
+            self._constant_env_params.pop(param.category_idx, None)
+            return
+
+        values = self._constant_fg_values[param.category_idx]
+        group_indices = self._constant_fg_group_indices[param.category_idx]
+        pos = group_indices.index(param.group_idx)
+        del values[pos]
+        del group_indices[pos]
 
     def get_unset_params(self) -> List[str]:
         """Get names of parameters that haven't been set"""
@@ -253,6 +349,10 @@ class ParameterManager:
             if param.param_type == ParameterType.UNSET
         ]
 
+    def get_set_params(self) -> List[str]:
+        """Get names of parameters set as either constant or variable"""
+        return [name for name, param in self.params.items() if param.is_set]
+
     def get_conflicting_params(self) -> List[str]:
         """Get empty list - this implementation prevents conflicts"""
         return []
@@ -266,43 +366,85 @@ class ParameterManager:
         Arguments:
             core (CoreInterface): Core instance to write to.
         """
-        # Group parameters by category for batch application
-        for cat_idx in range(len(self._fg_param_prefixes)):
-            values = []
-            group_indices = []
-
-            for param in self.params.values():
-                if (
-                    param.param_type == ParameterType.CONSTANT
-                    and not param.is_env_param
-                    and param.category_idx == cat_idx
-                ):
-                    values.append(param.value)
-                    group_indices.append(param.group_idx)
-
-            if group_indices:
-                setter_name = self._fg_param_to_setters[cat_idx]
-                setter = getattr(core.Ecotracer, setter_name)
-                setter(values, group_indices)
+        if core is not self._constant_bound_core:
+            self._bind_constant_setters(core)
 
-        # Apply environmental parameters
-        for param in self.params.values():
-            if param.param_type == ParameterType.CONSTANT and param.is_env_param:
-                setter_name = self._env_param_to_setter[param.category_idx]
-                setter = getattr(core.Ecotracer, setter_name)
-                setter(param.value)
+        for setter, args in self._constant_setters:
+            setter(*args)
+
+    def bind_core(self, core: CoreInterface) -> None:
+        """Resolve the constant and variable parameter setters against the given core.
+
+        Applying parameters binds the setters on first use with a new core, calling this
+        ahead of time moves that work out of the first scenario run.
+
+        Arguments:
+            core (CoreInterface): Core instance parameters will be written to.
+        """
+        self._bind_constant_setters(core)
+        self._bind_variable_setters(core)
+
+    def _bind_constant_setters(self, core: CoreInterface) -> None:
+        """Pair the setters for categories holding constants with their arguments.
+
+        Categories without any constant parameters are left out entirely, so applying
+        constants only calls the setters that have something to write.
+        """
+        tracer = core.Ecotracer
+        self._constant_setters = [
+            (getattr(tracer, self._fg_param_to_setters[cat_idx]), (values, group_idxs))
+            for cat_idx, (values, group_idxs) in enumerate(
+                zip(self._constant_fg_values, self._constant_fg_group_indices)
+            )
+            if group_idxs
+        ]
+        self._constant_setters.extend(
+            (getattr(tracer, self._env_param_to_setter[cat_idx]), (value,))
+            for cat_idx, value in self._constant_env_params.items()
+        )
+        self._constant_bound_core = core
 
     def set_variable_params(
-        self, param_names: List[str], df_indices: List[int]
+        self,
+        param_names: List[str],
+        df_indices: Sequence[int],
+        unset_others: bool = False,
     ) -> None:
-        """Set parameters as variable with dataframe column indices."""
-        for name, idx in zip(param_names, df_indices):
-            if name not in self.params:
-                raise ValueError(f"Unknown parameter: {name}")
-            self.params[name].set_as_variable(idx)
+        """Set parameters as variable with dataframe column indices.
 
-        # Reset processed flag to ensure recalculation
-        self._variable_params_processed = False
+        Setting the same columns again, as when running several batches with the same
+        scenario dataframe layout, keeps the prepared tables and bound setters.
+
+        Arguments:
+            param_names (List[str]): Names of the parameters to make variable.
+            df_indices (Sequence[int]): Scenario dataframe column of each parameter.
+            unset_others (bool): Unset variable parameters not in param_names, so the
+                variables match the columns of a new scenario dataframe exactly.
+        """
+        changed = False
+        try:
+            for name, idx in zip(param_names, df_indices):
+                if name not in self.params:
+                    raise ValueError(f"Unknown parameter: {name}")
+                param = self.params[name]
+                if param.param_type == ParameterType.VARIABLE and param.df_idx == idx:
+                    continue
+                changed = True
+                if param.param_type == ParameterType.CONSTANT:
+                    self._discard_constant(param)
+                    self._constant_bound_core = None
+                param.set_as_variable(idx)
+
+            if unset_others:
+                keep = set(param_names)
+                for name, param in self.params.items():
+                    if param.param_type == ParameterType.VARIABLE and name not in keep:
+                        param.unset()
+                        changed = True
+        finally:
+            # Keep the prepared tables in line with any parameters already changed
+            if changed:
+                self._process_variable_params()
 
     def _process_variable_params(self) -> None:
         """Pre-calculate variable parameter information for efficient scenario runs.
@@ -310,16 +452,14 @@ class ParameterManager:
         For each variable parameter, construct lists of indices indicating which parameters
         for which functional groups should be written to the EwE core instance. Furthermore,
         store the column index in the scenario dataframe that variables are store in. This
-        is only calculated once, repeated calls will do nothing, until '_variable_params
-        processed' is set to False.
+        is rebuilt whenever the set of variable parameters changes, so applying a scenario
+        does no preprocessing.
         """
-        if self._variable_params_processed:
-            return
-
         # Reset existing calculations
         self._variable_fg_indices = [[] for _ in range(len(self._fg_param_prefixes))]
         self._variable_fg_df_indices = [[] for _ in range(len(self._fg_param_prefixes))]
         self._variable_env_params = []
+        self._bound_core = None
 
         # Process functional group parameters
         for param in self.params.values():
@@ -339,7 +479,51 @@ class ParameterManager:
                         param.df_idx
                     )
 
-        self._variable_params_processed = True
+        # Store scenario column indices as arrays so values are gathered in one indexing op
+        self._variable_fg_df_indices = [
+            np.asarray(df_idxs, dtype=np.intp)
+            for df_idxs in self._variable_fg_df_indices
+        ]
+        # One reusable buffer per category to gather scenario values into
+        self._variable_fg_buffers = [
+            np.empty(len(df_idxs), dtype=np.float64)
+            for df_idxs in self._variable_fg_df_indices
+        ]
+
+    def _bind_variable_setters(self, core: CoreInterface) -> None:
+        """Resolve the setters used by apply_variable_params against the given core.
+
+        Stores each setter as a bound method alongside the indices it writes, so applying a
+        scenario performs no attribute lookups. Rebound whenever a different core is used.
+        """
+        tracer = core.Ecotracer
+        self._variable_fg_setters = [
+            (
+                getattr(tracer, self._fg_param_to_setters[cat_idx]),
+                group_idxs,
+                df_idxs,
+                self._variable_fg_buffers[cat_idx],
+            )
+            for cat_idx, (group_idxs, df_idxs) in enumerate(
+                zip(self._variable_fg_indices, self._variable_fg_df_indices)
+            )
+            if group_idxs
+        ]
+        self._variable_env_setters = [
+            (getattr(tracer, setter_name), df_idx)
+            for _, df_idx, setter_name in self._variable_env_params
+        ]
+        self._bound_core = core
+
+    def __getstate__(self):
+        # Bound setters reference the core instance and cannot be sent to workers.
+        state = self.__dict__.copy()
+        state["_bound_core"] = None
+        state["_variable_fg_setters"] = []
+        state["_variable_env_setters"] = []
+        state["_constant_bound_core"] = None
+        state["_constant_setters"] = []
+        return state
 
     def apply_variable_params(
         self, core: CoreInterface, scenario_values: List[float]
@@ -347,31 +531,26 @@ class ParameterManager:
         """Apply variable parameters for a scenario to the core interface efficiently
 
         Given a list of parameter values for a given scenario, write them into the core
-        instance prior to a model run. If the variable parameter datastructures to help with
-        efficient writing have not been constructed, construct them.
+        instance prior to a model run. The datastructures used to write the values are
+        prepared when variable parameters are set.
 
         Arguments:
-            scenario_values (list[float]): List of parameter values in the same order as the
-                columns passed to the set_variable_params function.
+            scenario_values (Union[list[float], np.ndarray]): Parameter values in the same
+                order as the columns passed to the set_variable_params function.
 
         Returns:
             None
         """
-        # Process variable params if not already done
-        self._process_variable_params()
+        if core is not self._bound_core:
+            self._bind_variable_setters(core)
+
+        values = np.asarray(scenario_values, dtype=np.float64)
 
         # Apply functional group parameters
-        for cat_idx in range(len(self._fg_param_prefixes)):
-            if self._variable_fg_indices[cat_idx]:
-                values = [
-                    scenario_values[df_idx]
-                    for df_idx in self._variable_fg_df_indices[cat_idx]
-                ]
-                setter_name = self._fg_param_to_setters[cat_idx]
-                setter = getattr(core.Ecotracer, setter_name)
-                setter(values, self._variable_fg_indices[cat_idx])
+        for setter, group_idxs, df_idxs, buffer in self._variable_fg_setters:
+            np.take(values, df_idxs, out=buffer)
+            setter(buffer.tolist(), group_idxs)
 
         # Apply environmental parameters
-        for env_idx, df_idx, setter_name in self._variable_env_params:
-            setter = getattr(core.Ecotracer, setter_name)
-            setter(scenario_values[df_idx])
+        for setter, df_idx in self._variable_env_setters:
+            setter(float(values[df_idx]))
@@ -25,6 +25,7 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_conc_end_extractor",
         "extractor_input": "",  # only for packed variables
         "save_filename": "Concentration_end",
+        "dtype": "float64",
     },
     "Concentration": {
         "variable_name": "Concentration",
@@ -34,6 +35,7 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_conc_extractor",
         "extractor_input": "",  # only for packed variables
         "save_filename": "Concentration",
+        "dtype": "float64",
     },
     "Concentration Biomass": {
         "variable_name": "Concentration_Biomass",
@@ -43,6 +45,7 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_conc_biomass_extractor",
         "extractor_input": "",
         "save_filename": "Concentration_Biomass",
+        "dtype": "float64",
     },
     "Biomass": {
         "variable_name": "Biomass",
@@ -52,6 +55,7 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_ecosim_group_stats_extractors",
         "extractor_input": "Biomass",
         "save_filename": "Biomass",
+        "dtype": "float32",
     },
     "Relative Biomass": {
         "variable_name": "Relative Biomass",
@@ -61,6 +65,7 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_ecosim_group_stats_extractors",
         "extractor_input": "BiomassRel",
         "save_filename": "Relative_Biomass",
+        "dtype": "float32",
     },
     "Catch": {
         "variable_name": "Catch",
@@ -70,6 +75,7 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_ecosim_group_stats_extractors",
         "extractor_input": "Yield",  # see cEcosimResultWriter.vb where catch is yield
         "save_filename": "Catch",
+        "dtype": "float32",
     },
     "Consumption Biomass": {
         "variable_name": "Consumption Biomass",
@@ -79,6 +85,7 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_ecosim_group_stats_extractors",
         "extractor_input": "ConsumpBiomass",
         "save_filename": "Consumption_Biomass",
+        "dtype": "float32",
     },
     "Mortality": {
         "variable_name": "Mortality",
@@ -88,6 +95,7 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_ecosim_group_stats_extractors",
         "extractor_input": "TotalMort",
         "save_filename": "Mortality",
+        "dtype": "float32",
     },
     "Trophic Level": {
         "variable_name": "Trophic Level",
@@ -97,6 +105,7 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_ecosim_group_stats_extractors",
         "extractor_input": "TL",
         "save_filename": "Trophic_Level",
+        "dtype": "float32",
     },
     "Trophic Level Catch": {
         "variable_name": "Trophic Level Catch",
@@ -106,6 +115,7 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_TL_catch_extractor",
         "extractor_input": "",
         "save_filename": "Trophic_Level_Catch",
+        "dtype": "float32",
     },
     "FIB": {
         "variable_name": "FIB",
@@ -115,6 +125,7 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_FIB_extractor",
         "extractor_input": "",
         "save_filename": "FIB",
+        "dtype": "float32",
     },
     "KemptonsQ": {
         "variable_name": "KemptonsQ",
@@ -124,6 +135,7 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_Kemptons_extractor",
         "extractor_input": "",
         "save_filename": "KemptonsQ",
+        "dtype": "float32",
     },
     "Shannon Diversity": {
         "variable_name": "Shannon Diversity",
@@ -133,5 +145,6 @@ VARIABLE_CONFIG = {
         "extractor_name": "create_shannon_diversity_extractor",
         "extractor_input": "",
         "save_filename": "Shannon_Diversity",
+        "dtype": "float32",
     },
 }
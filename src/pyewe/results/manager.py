@@ -1,8 +1,9 @@
 import pandas as pd
 import numpy as np
 import xarray as xr
-import multiprocessing as mp
+from multiprocessing.shared_memory import SharedMemory
 from datetime import datetime
+from functools import lru_cache, partial
 from typing import Optional
 from numpy.ctypeslib import ctypes
 
@@ -11,48 +12,94 @@ from .results_set import ResultSet
 from ..core import results_extraction
 
 
+_DIM_LEN = {
+    "scenario": lambda n_scenarios, n_groups, n_months: n_scenarios,
+    "group": lambda n_scenarios, n_groups, n_months: n_groups,
+    "time": lambda n_scenarios, n_groups, n_months: n_months,
+    # Functional groups + environment group.
+    "env_group": lambda n_scenarios, n_groups, n_months: n_groups + 1,
+}
+
+_DIM_VALUES = {
+    "scenario": lambda n_scenarios, group_names, n_months: range(n_scenarios),
+    "group": lambda n_scenarios, group_names, n_months: group_names,
+    "time": lambda n_scenarios, group_names, n_months: range(n_months),
+    # Functional groups + environment group.
+    "env_group": lambda n_scenarios, group_names, n_months: [
+        "Environment",
+        *group_names,
+    ],
+}
+
+
 def select_dim_len(
     dim_name: str, n_scenarios: int, n_groups: int, n_months: int
 ) -> int:
     """Given the dimension name, select the length of the dimension."""
-    if dim_name == "scenario":
-        return n_scenarios
-    elif dim_name == "group":
-        return n_groups
-    elif dim_name == "time":
-        return n_months
-    elif dim_name == "env_group":
-        return n_groups + 1  # Functional groups + environment group.
-    raise ValueError(f"Dimension {dim_name} not supported.")
+    try:
+        dim_len = _DIM_LEN[dim_name]
+    except KeyError:
+        raise ValueError(f"Dimension {dim_name} not supported.") from None
+    return dim_len(n_scenarios, n_groups, n_months)
 
 
 def select_dim_values(dim_name: str, n_scenarios: int, group_names, n_months: int):
     """Given a dimension name, construct the values for the coordinates."""
-    if dim_name == "scenario":
-        return range(n_scenarios)
-    elif dim_name == "group":
-        return group_names
-    elif dim_name == "time":
-        return range(n_months)
-    elif dim_name == "env_group":
-        return ["Environment", *group_names]  # Functional groups + environment group.
-    raise ValueError(f"Dimension {dim_name} not supported.")
+    try:
+        dim_values = _DIM_VALUES[dim_name]
+    except KeyError:
+        raise ValueError(f"Dimension {dim_name} not supported.") from None
+    return dim_values(n_scenarios, group_names, n_months)
+
+
+@lru_cache(maxsize=None)
+def _get_var_layout(
+    variable_name: str, n_scenarios: int, n_groups: int, n_months: int
+) -> tuple[tuple[int, ...], list[str], np.dtype]:
+    """Get the shape, dimension names and dtype of a variable's result store."""
+    var_conf = VARIABLE_CONFIG[variable_name]
+    var_shape = tuple(
+        select_dim_len(dim_n, n_scenarios, n_groups, n_months)
+        for dim_n in var_conf["dims"]
+    )
+    var_dims_names = CATEGORY_CONFIG[var_conf["category"]]["dims"]
+    return var_shape, var_dims_names, np.dtype(var_conf["dtype"])
 
 
 def construct_var_buffer(
     variable_name: str, n_scenarios: int, n_groups: int, n_months: int
 ):
-    """Given an variable names, construct a multiprocessor buffer."""
-    # Get variable specification
-    var_conf = VARIABLE_CONFIG[variable_name]
-    var_cat = var_conf["category"]
-    # Get dimensions spec
-    var_dims = var_conf["dims"]
-    var_shape = [
-        select_dim_len(dim_n, n_scenarios, n_groups, n_months) for dim_n in var_dims
-    ]
-    # Create an array with 64 bit float
-    return mp.Array("d", int(np.prod(var_shape)))
+    """Given an variable names, construct a shared memory buffer for worker processes.
+
+    Workers write disjoint scenario slices, so the buffer does not need a lock. The caller
+    owns the returned block and is responsible for closing and unlinking it.
+    """
+    var_shape, _, dtype = _get_var_layout(
+        variable_name, n_scenarios, n_groups, n_months
+    )
+    n_bytes = int(np.prod(var_shape)) * dtype.itemsize
+    return SharedMemory(create=True, size=max(n_bytes, 1))
+
+
+def construct_local_buffers(
+    var_names: list[str], n_scenarios: int, n_groups: int, n_months: int
+) -> dict[str, np.ndarray]:
+    """Allocate in-process result buffers for the given variables.
+
+    Variables with the same shape and dtype share a single contiguous allocation, each
+    taking one slice of it.
+    """
+    by_layout: dict[tuple, list[str]] = {}
+    for vn in var_names:
+        var_shape, _, dtype = _get_var_layout(vn, n_scenarios, n_groups, n_months)
+        by_layout.setdefault((var_shape, dtype), []).append(vn)
+
+    buffers = {}
+    for (var_shape, dtype), layout_vars in by_layout.items():
+        block = np.empty((len(layout_vars), *var_shape), dtype=dtype)
+        for i, vn in enumerate(layout_vars):
+            buffers[vn] = block[i]
+    return buffers
 
 
 def construct_xarray(
@@ -62,6 +109,8 @@ def construct_xarray(
     n_months: int,
     first_year: int,
     buffer=None,
+    run_date: Optional[str] = None,
+    dim_values: Optional[dict] = None,
 ):
     """Given a variable name and the size of dimensions, construct an empty xarray.
 
@@ -71,37 +120,44 @@ def construct_xarray(
         group_names (list[str]): List of names of functional groups
         n_months (int): Number of months the simulation is run for.
         first_year (int): First year of simulations
-        buffer (Optional[mp.array]): Multiprocessor buffer to use as underlying memory for
-            xarrray
+        buffer (Optional[memoryview]): Buffer to use as underlying memory for the
+            xarrray, such as shared memory or a slice of a block from
+            construct_local_buffers.
+        run_date (Optional[str]): Timestamp recorded as the run date. Defaults to now.
+        dim_values (Optional[dict]): Precomputed coordinate values for each dimension
+            name. Computed from the other arguments if not given.
     """
     # Get variable specification
     var_conf = VARIABLE_CONFIG[variable_name]
-    var_cat = var_conf["category"]
-    # Get dimensions spec
-    var_dims = var_conf["dims"]
-    var_shape = [
-        select_dim_len(dim_n, n_scenarios, len(group_names), n_months)
-        for dim_n in var_dims
-    ]
+    var_shape, var_dims_names, dtype = _get_var_layout(
+        variable_name, n_scenarios, len(group_names), n_months
+    )
+    if var_dims_names[0] != STD_DIM_NAMES["scenario"]:
+        msg = f"Variable {variable_name} must have scenario as its first dimension. "
+        msg += f"Received dimensions {var_dims_names}."
+        raise ValueError(msg)
     # Construct dimensions for xarray
-    # Get standard dimension names
-    var_dims_names = CATEGORY_CONFIG[var_cat]["dims"]
-    coords = [
-        select_dim_values(dim_n, n_scenarios, group_names, n_months)
-        for dim_n in var_dims
-    ]
+    if dim_values is None:
+        coords = [
+            select_dim_values(dim_n, n_scenarios, group_names, n_months)
+            for dim_n in var_conf["dims"]
+        ]
+    else:
+        coords = [dim_values[dim_n] for dim_n in var_conf["dims"]]
     if buffer is None:
-        data = np.empty(tuple(var_shape), dtype=float)
+        data = np.empty(var_shape, dtype=dtype)
     else:
-        data = np.frombuffer(buffer.get_obj(), dtype=np.float64).reshape(
-            tuple(var_shape)
-        )
+        # Shared memory blocks may be rounded up to a whole page
+        n_elems = int(np.prod(var_shape))
+        data = np.frombuffer(buffer, dtype=dtype, count=n_elems).reshape(var_shape)
 
     empty_xr = xr.DataArray(data, coords=coords, dims=var_dims_names)
     # Fill in attributes
     empty_xr.attrs["name"] = var_conf["variable_name"]
     empty_xr.attrs["unit"] = var_conf["unit"]
-    empty_xr.attrs["Run Date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if run_date is None:
+        run_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    empty_xr.attrs["Run Date"] = run_date
     empty_xr.attrs["First Year"] = first_year
 
     return empty_xr
@@ -112,9 +168,10 @@ def construct_extraction_objects(var_names, py_core) -> tuple[list, dict]:
     # Get the name of all extractor constructors
     extractor_names = [VARIABLE_CONFIG[var_n]["extractor_name"] for var_n in var_names]
     # Get unique names and so duplicate objects are not constructed
-    uniq_names = list(set(extractor_names))
+    uniq_names = list(dict.fromkeys(extractor_names))
     # For each variable, get an index for each unique extractor
-    extr_index = [uniq_names.index(var_n) for var_n in extractor_names]
+    name_to_idx = {name: i for i, name in enumerate(uniq_names)}
+    extr_index = [name_to_idx[var_n] for var_n in extractor_names]
     # Construct the extractors for each variable.
     uniq_extractor_objs = [
         getattr(results_extraction, extr)(py_core.get_core(), py_core.get_state())
@@ -146,6 +203,10 @@ class ResultManager:
             aligned with variable_ordering
         _packed_input (dict): name of variables to query result extractors when multiple variables
             are packaed into the same array in visual basic.
+        _var_np_views (dict): Numpy arrays backing each of the variable stores. Scenario is
+            always the leading axis.
+        _scenario_offset (int): Position of the first scenario within the full scenario
+            dataframe, when only a batch of it is being run.
     """
 
     def __init__(
@@ -154,16 +215,20 @@ class ResultManager:
         var_names,
         scenarios: pd.DataFrame,
         shared_store: Optional[dict] = None,
+        scenario_offset: int = 0,
     ):
         self._py_core = py_core
         self._var_names = var_names
         self._scenarios = scenarios
+        self._scenario_offset = scenario_offset
 
         self._n_months = py_core.Ecosim.get_n_years() * 12
         self._n_scenarios = len(scenarios)
         self._group_names = py_core.get_functional_group_names()
 
         first_year = self._py_core.get_first_year()
+        # All variables of a run share one timestamp
+        run_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         if not shared_store is None:
             if set(shared_store.keys()) != set(var_names):
@@ -171,24 +236,44 @@ class ResultManager:
                 msg += f". Received {shared_store.keys} and {var_names}"
                 raise KeyError(msg)
             # Construct variable stores from multiprocessing buffer
-            self.variable_stores = {
-                vn: construct_xarray(
-                    vn,
-                    self._n_scenarios,
-                    self._group_names,
-                    self._n_months,
-                    first_year,
-                    shared_store[vn],
-                )
-                for vn in var_names
-            }
+            buffers = shared_store
         else:
-            self.variable_stores = {
-                vn: construct_xarray(
-                    vn, self._n_scenarios, self._group_names, self._n_months, first_year
-                )
-                for vn in var_names
-            }
+            buffers = construct_local_buffers(
+                var_names, self._n_scenarios, len(self._group_names), self._n_months
+            )
+
+        # Coordinate indexes are built once and shared by all variables. Naming them after
+        # their dimension lets xarray use them without copying.
+        dim_values = {
+            dim_n: pd.Index(
+                select_dim_values(
+                    dim_n, self._n_scenarios, self._group_names, self._n_months
+                ),
+                name=STD_DIM_NAMES[dim_n],
+            )
+            for dim_n in _DIM_VALUES
+        }
+        # Batches keep the positions of their scenarios in the full scenario dataframe.
+        if scenario_offset != 0:
+            dim_values["scenario"] = dim_values["scenario"] + scenario_offset
+        self.variable_stores = {
+            vn: construct_xarray(
+                vn,
+                self._n_scenarios,
+                self._group_names,
+                self._n_months,
+                first_year,
+                buffers[vn],
+                run_date,
+                dim_values,
+            )
+            for vn in var_names
+        }
+
+        # Write results straight into the numpy arrays backing each store.
+        self._var_np_views = {
+            vn: arr.values for vn, arr in self.variable_stores.items()
+        }
 
         # Get the result extractors and a list of extractors aligned with variables
         self._unique_extractors, self._variable_extractors = (
@@ -199,18 +284,44 @@ class ResultManager:
             nm: VARIABLE_CONFIG[nm]["extractor_input"] for nm in var_names
         }
 
+        # Pair each variable's result getter, with any packed input already bound, with
+        # the array it is written to.
+        self._collect_plan = [
+            (
+                (
+                    self._variable_extractors[vn].get_result
+                    if self._packed_input[vn] == ""
+                    else partial(
+                        self._variable_extractors[vn].get_result, self._packed_input[vn]
+                    )
+                ),
+                self._var_np_views[vn],
+            )
+            for vn in var_names
+        ]
+
     @staticmethod
-    def construct_mp_result_manager(py_core, var_names, scenarios):
-        """Construct a result manager using multiprocessor arrays.
+    def construct_mp_result_manager(
+        py_core, var_names, scenarios, scenario_offset: int = 0
+    ):
+        """Construct a result manager along with shared memory buffers for workers.
 
-        Construct a result manager that uses multiprocessor arrays as the underlying buffer
-        for the stored xarrays.
+        Workers attach to the shared memory blocks by name and write their results into
+        them. The returned manager keeps its own stores, and the results are copied into
+        them with load_shared_stores once the workers are done, so the blocks can be
+        released straight after a run.
 
         Arguments:
             py_core (CoreInstance): Core instance to extract results from.
             var_names (list[str]): List of result varibles to store.
             scenarios (DataFrame): Dataframe containing the parameters used for each
                 scenario
+            scenario_offset (int): Position of the first scenario within the full scenario
+                dataframe, used as the start of the scenario coordinate.
+
+        Returns:
+            ResultManager: Result manager to collect the shared results into.
+            dict[str, SharedMemory]: Shared memory block for each variable.
         """
         _n_months = py_core.Ecosim.get_n_years() * 12
         _n_scenarios = len(scenarios)
@@ -221,28 +332,31 @@ class ResultManager:
             for vn in var_names
         }
 
-        manager = ResultManager(py_core, var_names, scenarios, mp_buffers)
+        manager = ResultManager(
+            py_core, var_names, scenarios, scenario_offset=scenario_offset
+        )
 
         return manager, mp_buffers
 
+    def load_shared_stores(self, mp_buffers: dict):
+        """Copy results written by workers into shared memory into the variable stores."""
+        for vn, shm in mp_buffers.items():
+            np_view = self._var_np_views[vn]
+            shared = np.frombuffer(shm.buf, dtype=np_view.dtype, count=np_view.size)
+            np_view[...] = shared.reshape(np_view.shape)
+            # Release the export so the block can be closed
+            del shared
+
     def refresh_result_stores(self):
         """Load the ecosim results into the Result Extraction Buffers."""
-        for extractor in self._unique_extractors:
-            extractor.refresh_buffer()
+        results_extraction.refresh_many(self._unique_extractors)
 
     def collect_results(self, scenario_idx: int):
         """Load the ecosim results into the variable_stores."""
         self.refresh_result_stores()
-        dim_index = {STD_DIM_NAMES["scenario"]: scenario_idx}
-        for var_name in self._var_names:
-            get_input = self._packed_input[var_name]
-            var_arr = self.variable_stores[var_name]
-            var_extr = self._variable_extractors[var_name]
-            var_arr[dim_index] = (
-                var_extr.get_result()
-                if get_input == ""
-                else var_extr.get_result(get_input)
-            )
+        for get_result, np_view in self._collect_plan:
+            # Scenario leads, so each write fills one contiguous block
+            np_view[scenario_idx] = get_result()
 
     def to_result_set(self):
         """Construct a results set from a result manager."""
@@ -1,15 +1,66 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
+import polars as pl
 import numpy as np
-from typing import Optional
 
-from .config import VARIABLE_CONFIG, CATEGORY_CONFIG
+from .config import VARIABLE_CONFIG
 
 
-def variable_arr_to_flat_df(var_arr):
-    """Convert an xarray to a flattened dataframe with the correct variable name."""
-    var_name = var_arr.attrs["name"]
-    return var_arr.to_dataframe(name=var_name).reset_index()
+# Target size of a single compressed chunk in netcdf and zarr output.
+_NETCDF_CHUNK_BYTES = 2**20
+_ZARR_CHUNK_BYTES = 4 * 2**20
+
+
+def _choose_chunks(
+    shape: tuple[int, ...], itemsize: int, target_bytes: int = _NETCDF_CHUNK_BYTES
+) -> tuple[int, ...]:
+    """Choose netcdf chunk sizes for a result array with scenario as the leading axis.
+
+    Each chunk starts as a single scenario spanning all other dimensions. The trailing
+    (time) dimension is reduced to the largest power of two that fits the target size, then
+    whole scenarios are added in powers of two while the chunk stays within the target.
+    """
+    chunks = [1, *shape[1:]]
+    inner_bytes = itemsize * int(np.prod(chunks[:-1]))
+    while (
+        len(chunks) > 1 and chunks[-1] > 1 and inner_bytes * chunks[-1] > target_bytes
+    ):
+        chunks[-1] = 2 ** ((chunks[-1] - 1).bit_length() - 1)
+
+    chunk_bytes = itemsize * int(np.prod(chunks))
+    while chunks[0] * 2 <= shape[0] and chunk_bytes * 2 <= target_bytes:
+        chunks[0] *= 2
+        chunk_bytes *= 2
+
+    return tuple(max(1, min(c, n)) for c, n in zip(chunks, shape))
+
+
+def write_csv(df: pd.DataFrame, path: str) -> None:
+    """Write a dataframe to csv using polars' multi-threaded writer.
+
+    Missing values are written as empty fields, matching pandas' to_csv.
+    """
+    columns = {str(col): df[col].to_numpy() for col in df.columns}
+    pl.DataFrame(columns, nan_to_null=True).write_csv(path)
+
+
+def variable_arr_to_series(var_arr) -> pd.Series:
+    """Convert an xarray to a series indexed by its dimensions, named after the variable."""
+    return var_arr.to_series().rename(var_arr.attrs["name"])
+
+
+def variable_arr_to_flat_df(var_arr) -> pd.DataFrame:
+    """Convert an xarray to a flattened dataframe with the correct variable name.
+
+    Columns are built straight from the coordinate and value arrays, without constructing
+    an intermediate multi-index.
+    """
+    coords = [var_arr.coords[dim].values for dim in var_arr.dims]
+    mesh = np.meshgrid(*coords, indexing="ij")
+    columns = {dim: m.ravel() for dim, m in zip(var_arr.dims, mesh)}
+    columns[var_arr.attrs["name"]] = var_arr.values.ravel()
+    return pd.DataFrame(columns, copy=False)
 
 
 class ResultSet:
@@ -56,43 +107,81 @@ Stored Results: {list(self.results.keys())}
         """Write all variables to netcdf files."""
         for var_name in self._variable_names:
             filename = VARIABLE_CONFIG[var_name]["save_filename"] + ".nc"
-            ds = self.results[var_name].to_dataset(name=var_name)
-            ds.to_netcdf(os.path.join(save_dir, filename))
-
-    def _write_dataframes(self, save_dir: str):
-        """Write all variables to csv files."""
-        categories = [
-            VARIABLE_CONFIG[var_n]["category"] for var_n in self._variable_names
-        ]
-        unique_cats = list(set(categories))
-        dfs: list[Optional[pd.DataFrame]] = [None] * len(unique_cats)
-
-        # Create a data frame for each category and add variables to each category.
-        for var_name, var_cat in zip(self._variable_names, categories):
-            cat_idx = unique_cats.index(var_cat)
-            df_arr = variable_arr_to_flat_df(self.results[var_name])
-
-            dfs[cat_idx] = (
-                df_arr
-                if dfs[cat_idx] is None
-                else pd.merge(
-                    dfs[cat_idx],
-                    df_arr,
-                    on=CATEGORY_CONFIG[var_cat]["dims"],
-                    how="outer",
-                )
+            var_arr = self.results[var_name]
+            ds = var_arr.to_dataset(name=var_name)
+            encoding = {
+                var_name: {
+                    "dtype": var_arr.dtype,
+                    "zlib": True,
+                    "complevel": 4,
+                    "shuffle": True,
+                    "chunksizes": _choose_chunks(var_arr.shape, var_arr.dtype.itemsize),
+                }
+            }
+            ds.to_netcdf(
+                os.path.join(save_dir, filename),
+                format="NETCDF4",
+                engine="netcdf4",
+                encoding=encoding,
             )
 
-        for df, cat_name in zip(dfs, unique_cats):
-            if df is None:
-                raise ValueError("Category data frame is None and was not initialised.")
+    def _write_zarrs(self, save_dir: str):
+        """Write all variables to zarr stores compressed with Blosc zstd."""
+        try:
+            from zarr.codecs import BloscCodec
+        except ImportError as e:
+            msg = 'Saving results as zarr requires the "zarr" package. '
+            msg += "Install it with the pyewe[zarr] extra."
+            raise ImportError(msg) from e
+
+        compressor = BloscCodec(cname="zstd", clevel=3, shuffle="bitshuffle")
+        for var_name in self._variable_names:
+            filename = VARIABLE_CONFIG[var_name]["save_filename"] + ".zarr"
+            var_arr = self.results[var_name]
+            ds = var_arr.to_dataset(name=var_name)
+            encoding = {
+                var_name: {
+                    "chunks": _choose_chunks(
+                        var_arr.shape, var_arr.dtype.itemsize, _ZARR_CHUNK_BYTES
+                    ),
+                    "compressors": (compressor,),
+                }
+            }
+            ds.to_zarr(os.path.join(save_dir, filename), mode="w", encoding=encoding)
 
-            df.to_csv(os.path.join(save_dir, cat_name + ".csv"), index=False)
+    def _write_dataframes(self, save_dir: str):
+        """Write all variables to csv files."""
+        # Group variables by category, keeping the order variables were stored in.
+        cat_vars: dict[str, list[str]] = {}
+        for var_name in self._variable_names:
+            var_cat = VARIABLE_CONFIG[var_name]["category"]
+            cat_vars.setdefault(var_cat, []).append(var_name)
+
+        # Categories are written to separate files, so they can be written concurrently.
+        # The polars writer releases the GIL while formatting and writing.
+        max_workers = max(1, min(4, len(cat_vars)))
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = [
+                ex.submit(self._write_category_csv, save_dir, cat_name, var_names)
+                for cat_name, var_names in cat_vars.items()
+            ]
+            for future in futures:
+                future.result()
+
+    def _write_category_csv(self, save_dir: str, cat_name: str, var_names: list[str]):
+        """Join all variables of a category on their dimensions and write them to csv."""
+        if len(var_names) == 1:
+            df = variable_arr_to_flat_df(self.results[var_names[0]])
+        else:
+            series = [variable_arr_to_series(self.results[vn]) for vn in var_names]
+            df = pd.concat(series, axis=1, join="outer").reset_index()
+        write_csv(df, os.path.join(save_dir, cat_name + ".csv"))
 
     def save_results(self, save_dir: str, formats: list[str]):
         """Write results to all formats given.
 
-        Only NetCDF4, "netcdf", and CSV, "csv", are currently supported.
+        Only NetCDF4, "netcdf", CSV, "csv", and Zarr, "zarr", are currently supported.
+        Zarr output needs the optional "zarr" package.
 
         Args:
             formats list[str]: list of formats to save results in.
@@ -102,3 +191,5 @@ Stored Results: {list(self.results.keys())}
             self._write_netcdfs(save_dir)
         if "csv" in formats:
             self._write_dataframes(save_dir)
+        if "zarr" in formats:
+            self._write_zarrs(save_dir)
@@ -1,29 +1,53 @@
 from warnings import warn
 from pandas import DataFrame
-from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Union, Dict, List, Optional
+from typing import Union, Dict, Iterator, List, Optional
 from tqdm.auto import tqdm
 
 import time
 import numpy as np
 import pandas as pd
-import shutil
 import os
 import math
-import atexit
+import weakref
+import pickle
 import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
 
 from .core import CoreInterface
 from .exceptions import EwEError, EcotracerError, EcosimError
 from .results import ResultManager, ResultSet
 from .parameter_management import ParameterManager
-from .worker import worker_init, worker_run_scenario, worker_clean_up
+from .worker import (
+    get_worker_model_path,
+    worker_init,
+    worker_load_batch,
+    worker_release_batch,
+    worker_run_scenario,
+)
+from .utils import copy_model_file, prefetch_file
+
+
+# Result variables saved by scenario runs when none are given.
+DEFAULT_SAVE_VARS = (
+    "Concentration",
+    "Concentration Biomass",
+    "Biomass",
+    "Catch",
+    "Consumption Biomass",
+    "Mortality",
+    "Trophic Level",
+    "Trophic Level Catch",
+    "FIB",
+    "KemptonsQ",
+    "Shannon Diversity",
+)
 
 
 def worker_run_scenario_wrapper(args):
-    scen_idx, scen_params = args
-    return worker_run_scenario(scen_idx, scen_params)
+    spec_name, spec_size, scen_idx = args
+    worker_load_batch(spec_name, spec_size)
+    return worker_run_scenario(scen_idx)
 
 
 def _check_scenario_column(col_names: list[str]):
@@ -34,6 +58,98 @@ def _check_scenario_column(col_names: list[str]):
         raise ValueError(msg)
 
 
+def _close_pool_resources(pool_resources: dict) -> None:
+    """Stop a worker pool, if running, and remove its model snapshot and worker copies.
+
+    Arguments:
+        pool_resources (dict): The "pool" and snapshot "model_path" of an interface,
+            either may be None. Both are set to None once released.
+    """
+    worker_pids = []
+    pool = pool_resources["pool"]
+    if pool is not None:
+        worker_pids = [proc.pid for proc in pool._pool]
+        pool.close()
+        pool.join()
+        pool_resources["pool"] = None
+        pool_resources["release_barrier"] = None
+
+    model_path = pool_resources["model_path"]
+    if model_path is not None:
+        # Workers remove their own copies as they stop, unless they were killed.
+        worker_paths = [get_worker_model_path(model_path, pid) for pid in worker_pids]
+        for path in (*worker_paths, model_path):
+            if os.path.exists(path):
+                os.remove(path)
+        pool_resources["model_path"] = None
+
+
+def _release_interface(
+    core_instance: CoreInterface, temp_dir, pool_resources: dict
+) -> None:
+    """Release the worker pool, model and temporary directory of an interface.
+
+    Defined outside the interface so that it can be used as the interface's finalizer
+    without keeping the interface alive.
+    """
+    _close_pool_resources(pool_resources)
+    core_instance.close_model()
+    print("Closed model.")
+    if temp_dir is not None:
+        max_retries = 10  # Try for 5 seconds (10 * 0.5s)
+        for i in range(max_retries):
+            try:
+                # The operation we expect to fail
+                temp_dir.cleanup()
+
+                # If it succeeds, print message and break the loop
+                msg = f"Temporary directory and model file at {temp_dir.name} has been removed."
+                print(msg)
+                break
+            except (PermissionError, OSError) as e:
+                if i < max_retries - 1:
+                    print(f"File is still locked, retrying... ({i+1}/{max_retries})")
+                    time.sleep(0.5)  # Wait half a second before trying again
+                else:
+                    print("ERROR: File lock was not released in time. Cleanup failed.")
+
+
+def _default_n_workers() -> int:
+    """Get the default number of workers, one per cpu, warning that it was not given."""
+    n_workers = os.cpu_count()
+    if n_workers is None:
+        raise RuntimeError("Failed to get number of cpus for default workers.")
+    warn(f"n_workers not specified, using default {n_workers}")
+    return n_workers
+
+
+def _make_mp_context():
+    """Make the multiprocessing context used to start workers.
+
+    Workers are forked from a forkserver that has already imported numpy and pandas, so
+    they neither inherit the parent's loaded EwE core, as with fork, nor re-import
+    everything, as with spawn. pyewe itself is not preloaded as importing it starts the
+    .NET runtime through pythonnet, which is not safe to fork. "__main__" is kept from
+    the default preload. Platforms without forkserver fall back to spawn.
+    """
+    try:
+        ctx = multiprocessing.get_context("forkserver")
+    except ValueError:
+        return multiprocessing.get_context("spawn")
+
+    # The preload is global to the forkserver context, so it is set once on import.
+    ctx.set_forkserver_preload(["__main__", "numpy", "pandas"])
+    return ctx
+
+
+_MP_CONTEXT = _make_mp_context()
+
+
+def _get_mp_context():
+    """Get the multiprocessing context used to start workers."""
+    return _MP_CONTEXT
+
+
 class EwEScenarioInterface:
     """Interface for running Ecopath with Ecosim scenarios.
 
@@ -42,6 +158,11 @@ class EwEScenarioInterface:
         _temp_model_path (str): Path to temporary model database file.
         _param_manager (ParameterManager): Parameter manager object to manage variable and
             constant params.
+        _pool_resources (dict): Worker pool kept alive between parallel runs, under
+            "pool", the model snapshot its workers copied, under "model_path", and the
+            barrier its workers release batches on, under "release_barrier".
+        _pool_key (Optional[tuple]): Settings the worker pool was started with.
+        _pool_stale (bool): Whether the model state changed since the workers copied it.
     """
 
     def __init__(
@@ -49,6 +170,7 @@ class EwEScenarioInterface:
         model_path: str,
         temp_model_path: Optional[str] = None,
         ecosim_scenario: Optional[str] = None,
+        readonly: bool = False,
     ):
         """Initialise a EwEScenarioInterface
 
@@ -64,20 +186,31 @@ class EwEScenarioInterface:
         'EwEScenarioInterface.cleanup()' is registered at exit but it also good practice to
         manually call this function after completion.
 
+        A read-only interface opens the given database in place without copying it, for
+        inspecting the model, e.g. listing parameter names or building scenario dataframes.
+        No scenarios are created, and methods that change the model or run scenarios raise
+        a RuntimeError.
+
         Arguments:
             model_path (str): Path to model database.
             temp_model_path (Optonal[str]): Path to where the model database should be
                 copied, the user is responsible for cleaning up the copy.
+            ecosim_scenario (Optional[str]): Name of an existing ecosim scenario to use.
+            readonly (bool): Open the model in place for inspection only.
         """
-        self._model_pauh = model_path
-        mod_path_obj = Path(model_path)
-        if not mod_path_obj.exists():
+        self._model_path = model_path
+        if not os.path.exists(model_path):
             raise FileNotFoundError(model_path)
 
-        self._debugged_model = not temp_model_path is None
+        self._readonly = readonly
+        self._debugged_model = temp_model_path is not None
+        self._temp_dir = None
 
         # The temporary directory should clean itself up
-        if not self._debugged_model:
+        if readonly:
+            # Nothing is written to the database, so it can be opened in place.
+            self._temp_model_path = model_path
+        elif not self._debugged_model:
             self._temp_dir = TemporaryDirectory()
             self._temp_model_path = os.path.join(
                 self._temp_dir.name, os.path.basename(model_path)
@@ -89,7 +222,8 @@ class EwEScenarioInterface:
             self._temp_model_path = temp_model_path
 
         # Create a copy to avoid modifying the original model file
-        shutil.copy2(model_path, self._temp_model_path)
+        if not readonly:
+            copy_model_file(model_path, self._temp_model_path)
 
         # Initialize core interface
         self._core_instance = CoreInterface()
@@ -98,7 +232,36 @@ class EwEScenarioInterface:
             msg = "Failed to load EwE model. Check that the model file is loadable via the GUI."
             raise EwEError(self._core_instance.get_state(), msg)
 
-        # Initialize scenarios
+        # Creating scenarios writes to the database, which read-only interfaces must not do.
+        self._ecosim_scenario = ecosim_scenario
+        if not readonly:
+            self._setup_scenarios(ecosim_scenario)
+
+        # Initialize parameter manager
+        self._param_manager = ParameterManager.EcotracerManager(self._core_instance)
+
+        # Worker pool for parallel runs, started on first use.
+        # Held in a dict shared with the finalizer, so it can stop the current pool.
+        self._pool_resources = {
+            "pool": None,
+            "model_path": None,
+            "release_barrier": None,
+        }
+        self._pool_key = None
+        self._pool_stale = False
+
+        # Clean up when the interface is garbage collected or at exit, in case the user
+        # doesn't clean up. Unlike an atexit callback this does not keep the interface alive.
+        self._finalizer = weakref.finalize(
+            self,
+            _release_interface,
+            self._core_instance,
+            self._temp_dir,
+            self._pool_resources,
+        )
+
+    def _setup_scenarios(self, ecosim_scenario: Optional[str]):
+        """Create or load the ecosim scenario, and create the temporary ecotracer scenario."""
         if ecosim_scenario is None:
             self._ecosim_scenario = "tmp_ecosim_scen"
             if not self._core_instance.Ecosim.new_scenario(
@@ -124,15 +287,19 @@ class EwEScenarioInterface:
             msg = "Failed to create and load temporary ecotracer scenario."
             raise EcotracerError(self._core_instance.get_state(), msg)
 
-        # Initialize parameter manager
-        self._param_manager = ParameterManager.EcotracerManager(self._core_instance)
-
-        # Clean up in case the user doesn't clean up.
-        atexit.register(self.cleanup)
+    def _assert_writable(self):
+        """Raise if the interface was opened read-only."""
+        if self._readonly:
+            msg = "EwEScenarioInterface was opened read-only. "
+            msg += "Construct it with readonly=False to change the model or run scenarios."
+            raise RuntimeError(msg)
 
     def reset_parameters(self):
         """Remove all saved constant and variable parameters names and values."""
-        self._param_manager = ParameterManager.EcotracerManager(self._core_instance)
+        self._assert_writable()
+        self._param_manager.reset()
+        # Workers may still hold values written for parameters that are now unset.
+        self._pool_stale = True
 
     def format_param_names(
         self, full_param_names: List[str], functional_groups: List[str]
@@ -149,12 +316,15 @@ class EwEScenarioInterface:
 
     def set_simulation_duration(self, n_years: int):
         """Set the number of years to run ecosim for."""
+        self._assert_writable()
+        self._pool_stale = True
         return self._core_instance.Ecosim.set_n_years(n_years)
 
     def set_constant_params(
         self, param_names: List[str], param_values: List[float]
     ) -> None:
         """Set parameters that are constant across scenarios"""
+        self._assert_writable()
         self._param_manager.set_constant_params(param_names, param_values)
 
     def _warn_unset_params(self):
@@ -168,19 +338,7 @@ class EwEScenarioInterface:
     def run_scenarios(
         self,
         scenarios: DataFrame,
-        save_vars=[
-            "Concentration",
-            "Concentration Biomass",
-            "Biomass",
-            "Catch",
-            "Consumption Biomass",
-            "Mortality",
-            "Trophic Level",
-            "Trophic Level Catch",
-            "FIB",
-            "KemptonsQ",
-            "Shannon Diversity",
-        ],
+        save_vars=DEFAULT_SAVE_VARS,
         show_progress=True,
         verbose=True,
     ) -> ResultSet:
@@ -195,12 +353,13 @@ class EwEScenarioInterface:
         Returns:
             results (ResultSet): Containing results
         """
+        self._assert_writable()
         col_names = [str(cl) for cl in scenarios.columns]
         _check_scenario_column(col_names)
 
-        # Set variable parameters from dataframe columns (excluding scenario column)
+        # Variable parameters are exactly the non-scenario dataframe columns
         self._param_manager.set_variable_params(
-            col_names[1:], list(range(1, len(col_names)))
+            col_names[1:], range(1, len(col_names)), unset_others=True
         )
 
         # Apply constant parameters
@@ -217,21 +376,24 @@ class EwEScenarioInterface:
             scenarios,
         )
 
-        # Run each scenario
-        for idx, row in tqdm(
-            scenarios.iterrows(),
-            desc="Running scenarios",
-            total=scenarios.shape[0],
-            disable=not show_progress,
-        ):
-            # Apply variable parameters for this scenario
-            self._param_manager.apply_variable_params(self._core_instance, list(row))
+        # Run each scenario, the ecotracer scenario stays loaded throughout the loop.
+        scenario_values = scenarios.to_numpy(dtype=np.float64)
+        with self._core_instance.Ecotracer.scenario_asserted():
+            for idx in tqdm(
+                range(len(scenario_values)),
+                desc="Running scenarios",
+                disable=not show_progress,
+            ):
+                # Apply variable parameters for this scenario
+                self._param_manager.apply_variable_params(
+                    self._core_instance, scenario_values[idx]
+                )
 
-            # Run the model
-            self._core_instance.Ecotracer.run()
+                # Run the model
+                self._core_instance.Ecotracer.run()
 
-            # Save results
-            result_manager.collect_results(idx)
+                # Save results
+                result_manager.collect_results(idx)
 
         return result_manager.to_result_set()
 
@@ -239,86 +401,250 @@ class EwEScenarioInterface:
         self,
         scenarios: DataFrame,
         n_workers: Optional[int] = None,
-        save_vars=[
-            "Concentration",
-            "Concentration Biomass",
-            "Biomass",
-            "Catch",
-            "Consumption Biomass",
-            "Mortality",
-            "Trophic Level",
-            "Trophic Level Catch",
-            "FIB",
-            "KemptonsQ",
-            "Shannon Diversity",
-        ],
+        save_vars=DEFAULT_SAVE_VARS,
         show_progress=True,
+        chunksize: Optional[int] = None,
     ):
         """Run scenarios in parallel.
 
+        Workers are started with forkserver, or spawn where forkserver is not
+        available, and both import the main module of the calling script. Scripts must
+        call this under an ``if __name__ == "__main__":`` guard, otherwise each worker
+        runs the script again.
+
         Arguments:
             scenarios (DataFrame): Dataframe containing parameters for each scenario.
             n_workers (Optional[int]): Number of processes to run in parallel
+            chunksize (Optional[int]): Number of scenarios sent to a worker at a time. By
+                default about four chunks are made per worker. Use 1 for better load
+                balancing when scenario run times vary widely.
 
         Returns:
             ResultSet: results from scenario runs.
         """
+        if n_workers is None:
+            n_workers = _default_n_workers()
+
+        return self._run_parallel_batch(
+            scenarios, n_workers, save_vars, show_progress, chunksize
+        )
+
+    def _run_parallel_batch(
+        self,
+        scenarios: DataFrame,
+        n_workers: int,
+        save_vars,
+        show_progress: bool,
+        chunksize: Optional[int],
+        scenario_offset: int = 0,
+    ) -> ResultSet:
+        """Run a batch of scenarios on the worker pool.
+
+        Arguments:
+            scenario_offset (int): Position of the batch's first scenario within the full
+                scenario dataframe, so results of batches are numbered consistently.
+
+        See run_scenarios_parallel for the remaining arguments.
+        """
+        self._assert_writable()
         col_names = [str(cl) for cl in scenarios.columns]
         _check_scenario_column(col_names)
 
-        # Save scenarios so that when copied, new core instances have constant variables
-        self._core_instance.Ecosim.save_scenario()
-        self._core_instance.Ecotracer.save_scenario()
+        pool = self._get_pool(n_workers)
 
-        if n_workers is None:
-            n_workers = os.cpu_count()
-            if n_workers is None:
-                raise RuntimeError("Failed to get number of cpus for default workers.")
-            warn(f"n_workers not specified, using default {n_workers}")
-
-        # Result managers share the same result store but need different intermediate caches
+        # Workers write into shared buffers that are copied into this manager's stores.
         manager, mp_buffers = ResultManager.construct_mp_result_manager(
-            self._core_instance, save_vars, scenarios
+            self._core_instance, save_vars, scenarios, scenario_offset=scenario_offset
         )
-        n_scenarios = len(scenarios)
 
-        # Set variable parameters from dataframe columns (excluding scenario column)
+        # Variable parameters are exactly the non-scenario dataframe columns
         self._param_manager.set_variable_params(
-            col_names[1:], list(range(1, len(col_names)))
+            col_names[1:], range(1, len(col_names)), unset_others=True
         )
 
-        worker_init_args = (
-            self._temp_model_path,
-            self._param_manager,
-            mp_buffers,
-            save_vars,
-            scenarios,
-            self._ecosim_scenario,
+        # Workers read the batch configuration from shared memory once each.
+        spec = pickle.dumps(
+            {
+                "param_manager": self._param_manager,
+                "var_names": save_vars,
+                "scenarios": scenarios,
+                "buffers": {vn: shm.name for vn, shm in mp_buffers.items()},
+            }
         )
-
-        parallel_arg_pack = [(i, list(vals)) for (i, vals) in scenarios.iterrows()]
-        self._core_instance.close_model()
-
-        with multiprocessing.Pool(
-            processes=n_workers, initializer=worker_init, initargs=worker_init_args
-        ) as pool:
+        spec_shm = SharedMemory(create=True, size=len(spec))
+        spec_shm.buf[: len(spec)] = spec
+
+        try:
+            # Workers read scenario parameters from the batch specification, so tasks
+            # are generated lazily and only carry the scenario index.
+            n_scenarios = len(scenarios)
+            parallel_arg_pack = (
+                (spec_shm.name, len(spec), i) for i in range(n_scenarios)
+            )
+            # About four chunks per worker keeps workers fed as others finish early
+            if chunksize is None:
+                chunksize = math.ceil(n_scenarios / (n_workers * 4))
+            chunksize = max(1, chunksize)
             results_iterator = pool.imap_unordered(
-                worker_run_scenario_wrapper, parallel_arg_pack, chunksize=1
+                worker_run_scenario_wrapper, parallel_arg_pack, chunksize=chunksize
             )
 
             for _ in tqdm(
                 results_iterator,
-                total=len(parallel_arg_pack),
+                total=n_scenarios,
                 desc="Running scenarios",
                 disable=not show_progress,
             ):
                 continue
 
-            print("Finished runs. Cleaning up workers.")
+            manager.load_shared_stores(mp_buffers)
+        finally:
+            try:
+                # Workers stay attached to the batch until told, so unlinking frees it.
+                self._release_worker_batches(pool, spec_shm.name, n_workers)
+            finally:
+                for shm in (spec_shm, *mp_buffers.values()):
+                    shm.close()
+                    shm.unlink()
 
-        self._core_instance.load_model(self._temp_model_path)
         return manager.to_result_set()
 
+    def run_scenarios_parallel_iter(
+        self,
+        scenarios: DataFrame,
+        n_workers: Optional[int] = None,
+        save_vars=DEFAULT_SAVE_VARS,
+        batch_size: int = 64,
+        show_progress=True,
+    ) -> Iterator[ResultSet]:
+        """Run scenarios in parallel, yielding the results of each batch as it finishes.
+
+        Scenarios are run in consecutive batches of rows of the scenario dataframe, reusing
+        the same worker pool. Results of a batch can be processed or saved while later
+        batches are still to run, so all results never need to be held in memory at once.
+
+        Workers are started with forkserver, or spawn where forkserver is not
+        available, and both import the main module of the calling script. Scripts must
+        call this under an ``if __name__ == "__main__":`` guard, otherwise each worker
+        runs the script again.
+
+        Arguments:
+            scenarios (DataFrame): Dataframe containing parameters for each scenario.
+            n_workers (Optional[int]): Number of processes to run in parallel
+            save_vars (Sequence[str]): Names of the result variables to save.
+            batch_size (int): Number of scenarios in each batch.
+            show_progress (bool): Whether to show a progress bar over all scenarios.
+
+        Yields:
+            ResultSet: Results of the next batch of scenarios. Its scenarios attribute is
+                the slice of the scenario dataframe the batch covers, and its scenario
+                coordinate holds the positions of those rows in the full dataframe, so
+                batches can be concatenated along the scenario dimension.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}.")
+
+        if n_workers is None:
+            n_workers = _default_n_workers()
+
+        n_scenarios = len(scenarios)
+        with tqdm(
+            total=n_scenarios, desc="Running scenarios", disable=not show_progress
+        ) as progress:
+            for start in range(0, n_scenarios, batch_size):
+                batch = scenarios.iloc[start : start + batch_size]
+                batch_results = self._run_parallel_batch(
+                    batch, n_workers, save_vars, False, None, scenario_offset=start
+                )
+                progress.update(len(batch))
+                yield batch_results
+
+    def _get_pool(self, n_workers: int):
+        """Get the worker pool, starting a new one if settings or the model changed.
+
+        Workers load a snapshot of the model database when they start and keep it loaded
+        between runs. The snapshot is retaken and the pool restarted when the number of
+        workers changes or when the model was changed through this interface since the
+        workers started.
+
+        Arguments:
+            n_workers (int): Number of worker processes.
+
+        Returns:
+            multiprocessing.Pool: Pool of initialised workers.
+        """
+        pool_key = (n_workers, self._ecosim_scenario)
+        if (
+            self._pool_resources["pool"] is not None
+            and self._pool_key == pool_key
+            and not self._pool_stale
+        ):
+            return self._pool_resources["pool"]
+
+        self._shutdown_pool()
+
+        # Save scenarios so that when copied, new core instances have constant variables
+        self._core_instance.Ecosim.save_scenario()
+        self._core_instance.Ecotracer.save_scenario()
+
+        # Workers copy from a snapshot so this model can be reopened straight away.
+        self._core_instance.close_model()
+        mod_path_stem, mod_path_ext = os.path.splitext(self._temp_model_path)
+        pool_model_path = mod_path_stem + "_pool" + mod_path_ext
+        self._pool_resources["model_path"] = pool_model_path
+        copy_model_file(self._temp_model_path, pool_model_path)
+        self._reload_model()
+        # Every worker copies the snapshot as it starts, have it read into memory once.
+        prefetch_file(pool_model_path)
+
+        ctx = _get_mp_context()
+        release_barrier = ctx.Barrier(n_workers)
+        pool = ctx.Pool(
+            processes=n_workers,
+            initializer=worker_init,
+            initargs=(pool_model_path, self._ecosim_scenario, release_barrier),
+        )
+        self._pool_resources["pool"] = pool
+        self._pool_resources["release_barrier"] = release_barrier
+        self._pool_key = pool_key
+        self._pool_stale = False
+        return pool
+
+    def _release_worker_batches(self, pool, spec_name: str, n_workers: int) -> None:
+        """Have every worker drop its result manager and shared buffers of a batch.
+
+        Arguments:
+            pool (multiprocessing.Pool): Pool that ran the batch.
+            spec_name (str): Name of the shared memory block holding the batch
+                specification.
+            n_workers (int): Number of worker processes in the pool.
+        """
+        pool.map(worker_release_batch, [spec_name] * n_workers, chunksize=1)
+
+        # A worker timing out breaks the barrier, reset it for the next batch.
+        release_barrier = self._pool_resources["release_barrier"]
+        if release_barrier.broken:
+            release_barrier.reset()
+
+    def _reload_model(self):
+        """Load the temporary model database and its scenarios again after closing it."""
+        if not self._core_instance.load_model(self._temp_model_path):
+            msg = f"Failed to reload EwE model {self._temp_model_path}."
+            raise EwEError(self._core_instance.get_state(), msg)
+
+        if not self._core_instance.Ecosim.load_scenario(self._ecosim_scenario):
+            msg = f"Failed to reload ecosim scenario {self._ecosim_scenario}."
+            raise EcosimError(self._core_instance.get_state(), msg)
+
+        if not self._core_instance.Ecotracer.load_scenario("tmp_ecotracer_scen"):
+            msg = "Failed to reload temporary ecotracer scenario."
+            raise EcotracerError(self._core_instance.get_state(), msg)
+
+    def _shutdown_pool(self):
+        """Stop the worker pool, if running, and remove its model snapshot."""
+        _close_pool_resources(self._pool_resources)
+        self._pool_key = None
+
     def set_ecosim_group_info(self, group_info: DataFrame) -> None:
         """Set Ecosim group information parameters.
 
@@ -326,51 +652,50 @@ class EwEScenarioInterface:
         data frame should be in the same format with the same column names as the table in
         the EwE GUI.
         """
+        self._assert_writable()
+        self._pool_stale = True
         # Implementation needed
         n_consumers = self._core_instance.n_consumers()
-        cons_list = list(range(1, n_consumers + 1))
+        cons_list = range(1, n_consumers + 1)
 
         n_producers = self._core_instance.n_producers()
-        prod_list = list(range(n_consumers + 1, n_consumers + n_producers + 1))
-        self._core_instance.Ecosim.set_density_dep_catchability(
-            list(group_info["Density-dep. catchability: Qmax/Qo [>=1]"])[:n_consumers],
-            cons_list,
-        )
-        self._core_instance.Ecosim.set_feeding_time_adj_rate(
-            list(group_info["Feeding time adjust rate [0,1]"])[:n_consumers], cons_list
-        )
-        self._core_instance.Ecosim.set_max_rel_feeding_time(
-            list(group_info["Max rel. feeding time"])[:n_consumers], cons_list
-        )
-        self._core_instance.Ecosim.set_pred_effect_feeding_time(
-            list(group_info["Predator effect on feeding time [0,1]"])[:n_consumers],
-            cons_list,
-        )
-        self._core_instance.Ecosim.set_other_mort_feeding_time(
-            list(
-                group_info[
-                    "Fraction of other mortality sens. to changes in feeding time"
-                ]
-            )[:n_consumers],
-            cons_list,
-        )
-        self._core_instance.Ecosim.set_qbmax_qbio(
-            list(group_info["QBmax/QBo (for handling time) [>1]"])[:n_consumers],
-            cons_list,
-        )
-        self._core_instance.Ecosim.set_switching_power(
-            list(group_info["Switching power parameter [0,2]"])[:n_consumers], cons_list
-        )
-        self._core_instance.Ecosim.set_max_rel_pb(
-            list(group_info["Max rel. P/B"])[n_consumers : n_consumers + n_producers],
-            prod_list,
+        prod_list = range(n_consumers + 1, n_consumers + n_producers + 1)
+
+        # Extract all consumer columns in one conversion, then pass each column on.
+        ecosim = self._core_instance.Ecosim
+        cons_setters = {
+            "Density-dep. catchability: Qmax/Qo [>=1]": (
+                ecosim.set_density_dep_catchability
+            ),
+            "Feeding time adjust rate [0,1]": ecosim.set_feeding_time_adj_rate,
+            "Max rel. feeding time": ecosim.set_max_rel_feeding_time,
+            "Predator effect on feeding time [0,1]": (
+                ecosim.set_pred_effect_feeding_time
+            ),
+            "Fraction of other mortality sens. to changes in feeding time": (
+                ecosim.set_other_mort_feeding_time
+            ),
+            "QBmax/QBo (for handling time) [>1]": ecosim.set_qbmax_qbio,
+            "Switching power parameter [0,2]": ecosim.set_switching_power,
+        }
+        cons_values = group_info[list(cons_setters)].iloc[:n_consumers].to_numpy(
+            dtype=np.float64
         )
+        for col_values, setter in zip(cons_values.T, cons_setters.values()):
+            setter(col_values.tolist(), cons_list)
+
+        prod_values = group_info["Max rel. P/B"].iloc[
+            n_consumers : n_consumers + n_producers
+        ]
+        ecosim.set_max_rel_pb(prod_values.to_numpy(dtype=np.float64).tolist(), prod_list)
         warn("Additive prop. of predation mortality [0, 1]. Not yet supported.")
 
         return None
 
     def add_forcing_function(self, name: str, values: list[float]):
         """Add/Register forcing function for use in scenario runs."""
+        self._assert_writable()
+        self._pool_stale = True
         return self._core_instance.add_forcing_function(name, values)
 
     def set_ecosim_vulnerabilities(self, vulnerabilities: DataFrame) -> None:
@@ -379,6 +704,8 @@ class EwEScenarioInterface:
         Set the vulnerabilitiy coefficient used in the Ecosim model. The format for the
         input dataframe should be the same format as seen in the EwE GUI.
         """
+        self._assert_writable()
+        self._pool_stale = True
         # Implementation needed
         fg_names: list[str] = self._core_instance.get_functional_group_names()
         if "Prey \\ predator" in vulnerabilities.columns:
@@ -392,7 +719,7 @@ class EwEScenarioInterface:
             raise ValueError("Unable to find Prey \\ Predator column in Dataframe.")
 
         first_col_idx = list(vulnerabilities.columns).index("1")
-        arr_vuln = np.array(vulnerabilities.iloc[0:, first_col_idx:])
+        arr_vuln = vulnerabilities.iloc[:, first_col_idx:].to_numpy(dtype=np.float64)
 
         n_groups = self._core_instance.n_groups()
         n_consumers = self._core_instance.n_consumers()
@@ -422,9 +749,9 @@ class EwEScenarioInterface:
         """
         # Validate environmental parameter names
         for name in env_param_names:
-            if name not in self._param_manager._env_param_names:
+            if name not in self._param_manager._env_param_names_set:
                 msg = f"Invalid parameter name: {name}. Make sure all are "
-                msg += f"elements of {ParameterManager._env_param_names}."
+                msg += f"elements of {self._param_manager._env_param_names}."
                 raise ValueError(msg)
 
         # Get functional group parameter names
@@ -436,7 +763,8 @@ class EwEScenarioInterface:
         empty[:, 0] = np.arange(1, n_scenarios + 1)
 
         cols.insert(0, "scenario")
-        return DataFrame(empty, columns=cols)
+        # The array is not used elsewhere, so the dataframe can take it without a copy.
+        return DataFrame(empty, columns=cols, copy=False)
 
     def get_long_scen_dataframe(self):
         """Get the full scenario dataframe in a long format.
@@ -476,29 +804,6 @@ class EwEScenarioInterface:
 
         Close the model database and delete the temporary directory containing the model.
         """
-        self._core_instance.close_model()
-        print("Closed model.")
-        if not self._debugged_model:
-            max_retries = 10  # Try for 5 seconds (10 * 0.5s)
-            for i in range(max_retries):
-                try:
-                    # The operation we expect to fail
-                    self._temp_dir.cleanup()
-
-                    # If it succeeds, print message and break the loop
-                    msg = f"Temporary directory and model file at {self._temp_dir.name} has been removed."
-                    print(msg)
-                    break
-                except (PermissionError, OSError) as e:
-                    if i < max_retries - 1:
-                        print(
-                            f"File is still locked, retrying... ({i+1}/{max_retries})"
-                        )
-                        time.sleep(0.5)  # Wait half a second before trying again
-                    else:
-                        print(
-                            "ERROR: File lock was not released in time. Cleanup failed."
-                        )
-
-        # If the user cleans up, no need to run at exit.
-        atexit.unregister(self.cleanup)
+        # The finalizer only runs once, whether called here, on collection or at exit.
+        # It also stops the worker pool, which may otherwise keep its processes alive.
+        self._finalizer()
@@ -0,0 +1,58 @@
+import os
+import shutil
+
+
+def copy_model_file(src: str, dst: str) -> None:
+    """Copy a model database file, letting the kernel clone its data where possible.
+
+    On Linux, os.copy_file_range copies without passing data through user space, and
+    copy-on-write filesystems (btrfs, XFS) can share the data blocks instead of writing
+    them. Other platforms, and any failure, fall back to shutil.copy2. A hard link is not
+    used since EwE writes scenarios to the copy, which must not change the source model.
+
+    Arguments:
+        src (str): Path to the model database to copy.
+        dst (str): Path to write the copy to.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n_copied = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), remaining
+                    )
+                    if n_copied == 0:
+                        break
+                    remaining -= n_copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return None
+        except OSError:
+            pass
+
+    shutil.copy2(src, dst)
+    return None
+
+
+def prefetch_file(path: str) -> None:
+    """Ask the OS to read a file into the page cache ahead of use.
+
+    Used before starting workers so that their copies of the model database read from
+    memory rather than each hitting the disk. Does nothing where posix_fadvise is not
+    available.
+
+    Arguments:
+        path (str): Path to the file to prefetch.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return None
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+    return None
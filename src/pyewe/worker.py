@@ -8,15 +8,19 @@ interface.
 """
 
 import os
-import shutil
-import atexit
+import pickle
+import threading
+from multiprocessing import util
+import numpy as np
+from multiprocessing.shared_memory import SharedMemory
 from typing import Optional
-from pandas import DataFrame
 
 from .core.module import initialise, get_ewe_bin_path
 from .parameter_management import ParameterManager
 from .core.interface import CoreInterface
 from .results.manager import ResultManager
+from .utils import copy_model_file
+from .exceptions import EcotracerError
 
 # globals to be reused between scenarios by the worker.
 worker_core: Optional[CoreInterface] = None
@@ -24,32 +28,58 @@ worker_param_manager: Optional[ParameterManager] = None
 worker_result_manager: Optional[ResultManager] = None
 worker_model_path: Optional[str] = None
 
+# Name of the shared batch specification the worker is currently configured for.
+worker_batch_name: Optional[str] = None
+worker_shared_buffers: dict[str, SharedMemory] = {}
+worker_scenario_values = None
+# Parameters written to the worker's core by the current batch and those before it.
+worker_written_params: frozenset[str] = frozenset()
+# Barrier shared by the pool's workers so each takes exactly one release task.
+worker_release_barrier = None
+
+# Seconds a worker waits for the others while releasing a batch.
+RELEASE_TIMEOUT = 60.0
+
+# Ecotracer scenario the scenario interface saves into the model snapshot.
+ECOTRACER_SCENARIO = "tmp_ecotracer_scen"
+
+
+def get_worker_model_path(source_model_path: str, pid: int) -> str:
+    """Get the path of the model database copy made by the worker with the given pid.
+
+    Arguments:
+        source_model_path (str): Path to the model database snapshot the worker copies.
+        pid (int): Process id of the worker.
+
+    Returns:
+        str: Path to the worker's copy, next to the snapshot.
+    """
+    mod_path_stem, mod_path_ext = os.path.splitext(source_model_path)
+    return mod_path_stem + f"_tmp_{pid}" + mod_path_ext
+
 
 def worker_init(
     source_model_path: str,
-    param_manager: ParameterManager,
-    mp_buffers: dict,
-    var_names: list[str],
-    scenarios: DataFrame,
     ecosim_scenario: str = "tmp_ecosim_scenario",
+    release_barrier=None,
 ):
     """Initialise a worker, constructors the required globals.
 
     All variables passed to the initialiser are assumed to be constructed by the
     EwEScenarioInterface object. Its assumed the scenario interface has saved constant
     parameters to the 'tmp_ecosim_scenario' in the model database before this worker copies
-    the database.
+    the database. Workers are kept alive between batches of scenarios, and are configured
+    for each batch by worker_load_batch.
 
     Arguments:
-        source_model_path (str): Path to the temporary model database created by the
+        source_model_path (str): Path to the model database snapshot created by the
             scenario interface.
-        param_manager (ParameterManager): ParameterManager used to set parameters between
-            scenarios.
-        mp_buffers (dict): Dictionary of multiprocess array buffers to write results to.
-        var_names (list[str]): List of result names to save.
-        scenarios (DataFrame): Data frame containing parameters for each scenario.
+        ecosim_scenario (str): Name of the ecosim scenario to load.
+        release_barrier (Optional[multiprocessing.Barrier]): Barrier with one party per
+            worker, used by worker_release_batch.
     """
-    global worker_core, worker_param_manager, worker_result_manager, worker_model_path
+    global worker_core, worker_model_path, worker_release_barrier
+    worker_release_barrier = release_barrier
 
     # Initialise the EwE core module for the worker.
     initialise(get_ewe_bin_path())
@@ -58,16 +88,8 @@ def worker_init(
     worker_pid = os.getpid()
     print(f"Initialising worker with pid: {worker_pid}")
 
-    # Construct the new file name for the temporary model database.
-    mod_path_struct = os.path.splitext(source_model_path)
-    mod_path_stem = mod_path_struct[0]
-    mod_path_ext = mod_path_struct[1]
-
-    worker_model_path = mod_path_stem + f"_tmp_{worker_pid}" + mod_path_ext
-    if worker_model_path is None:
-        raise ValueError("Worker model path failed to initialise")
-
-    shutil.copy2(source_model_path, worker_model_path)
+    worker_model_path = get_worker_model_path(source_model_path, worker_pid)
+    copy_model_file(source_model_path, worker_model_path)
 
     # Initialise a core object that is not shared between workers.
     worker_core = CoreInterface()
@@ -76,23 +98,118 @@ def worker_init(
 
     # The scenario should have already setup constant parameters
     worker_core.Ecosim.load_scenario(ecosim_scenario)
-    worker_core.Ecotracer.load_scenario("tmp_ecotracer_scen")
+    worker_core.Ecotracer.load_scenario(ECOTRACER_SCENARIO)
+
+    # Pool workers leave through os._exit, which skips atexit handlers. Finalizers with an
+    # exit priority are still run when a worker stops after the pool is closed. Workers
+    # that are terminated instead leave their copy for the scenario interface to remove.
+    util.Finalize(None, worker_clean_up, exitpriority=10)
+    return None
+
+
+def _release_batch() -> None:
+    """Drop the result manager of the current batch and detach from its shared buffers."""
+    global worker_result_manager, worker_shared_buffers, worker_batch_name
+    global worker_scenario_values
+
+    # The result manager holds views into the shared buffers, drop it before closing them.
+    worker_result_manager = None
+    for shm in worker_shared_buffers.values():
+        shm.close()
+    worker_shared_buffers = {}
+    worker_scenario_values = None
+    worker_batch_name = None
+
+
+def worker_release_batch(spec_name: str) -> None:
+    """Release a finished batch, then wait for every other worker to take its release.
 
-    worker_param_manager = param_manager
+    The scenario interface sends one release task per worker once all scenarios of a batch
+    have run. Waiting on the barrier keeps a worker from taking a second release task, so
+    every worker detaches from the shared buffers and they are freed when unlinked.
+
+    Arguments:
+        spec_name (str): Name of the shared memory block holding the batch specification.
+    """
+    if spec_name == worker_batch_name:
+        _release_batch()
+
+    if worker_release_barrier is not None:
+        try:
+            worker_release_barrier.wait(RELEASE_TIMEOUT)
+        except threading.BrokenBarrierError:
+            # The interface resets the barrier, this worker has released its batch anyway.
+            pass
+    return None
+
+
+def worker_load_batch(spec_name: str, spec_size: int) -> None:
+    """Configure the worker for the batch of scenarios described by a shared specification.
+
+    The specification is a pickled dictionary written to shared memory by the scenario
+    interface. It contains the parameter manager, the names of result variables, the
+    scenario dataframe and the names of the shared result buffers. Repeated calls for the
+    same batch do nothing.
+
+    Arguments:
+        spec_name (str): Name of the shared memory block holding the specification.
+        spec_size (int): Size of the pickled specification in bytes.
+    """
+    global worker_param_manager, worker_result_manager, worker_shared_buffers
+    global worker_batch_name, worker_scenario_values, worker_written_params
+    if spec_name == worker_batch_name:
+        return None
+    if worker_core is None:
+        raise RuntimeError("Worker globals have not been initialised yet.")
+
+    spec_shm = SharedMemory(name=spec_name)
+    try:
+        with spec_shm.buf[:spec_size] as blob:
+            spec = pickle.loads(blob)
+    finally:
+        spec_shm.close()
+
+    _release_batch()
+    worker_shared_buffers = {
+        vn: SharedMemory(name=buf_name) for vn, buf_name in spec["buffers"].items()
+    }
+    worker_param_manager = spec["param_manager"]
+
+    # Parameters written by earlier batches but not set in this one must go back to the
+    # snapshot's values, which are restored by reloading the ecotracer scenario.
+    set_params = frozenset(worker_param_manager.get_set_params())
+    if not worker_written_params <= set_params:
+        if not worker_core.Ecotracer.load_scenario(ECOTRACER_SCENARIO):
+            msg = f"Failed to reload ecotracer scenario {ECOTRACER_SCENARIO}."
+            raise EcotracerError(worker_core.get_state(), msg)
+    worker_written_params = set_params
+
+    # Scenario parameters are read from here so tasks only carry the scenario index.
+    worker_scenario_values = spec["scenarios"].to_numpy(dtype=np.float64)
     worker_result_manager = ResultManager(
-        worker_core, var_names, scenarios, shared_store=mp_buffers
+        worker_core,
+        spec["var_names"],
+        spec["scenarios"],
+        shared_store={vn: shm.buf for vn, shm in worker_shared_buffers.items()},
     )
 
     # In case there were constant parameters that do not get saved to the database.
+    worker_param_manager.bind_core(worker_core)
     worker_param_manager.apply_constant_params(worker_core)
-
-    # Make sure workers close and delete database files.
-    atexit.register(worker_clean_up)
+    worker_batch_name = spec_name
     return None
 
 
-def worker_run_scenario(scenario_idx: int, scenario_params: list[float]) -> None:
-    """Run a scenario with the worker."""
+def worker_run_scenario(
+    scenario_idx: int, scenario_params: Optional[list[float]] = None
+) -> None:
+    """Run a scenario with the worker.
+
+    Arguments:
+        scenario_idx (int): Position of the scenario in the batch's scenario dataframe.
+        scenario_params (Optional[list[float]]): Parameter values for the scenario. Taken
+            from the batch's scenario dataframe if not given.
+    """
     global worker_core, worker_param_manager, worker_result_manager
     if (
         worker_core is None
@@ -101,7 +218,11 @@ def worker_run_scenario(scenario_idx: int, scenario_params: list[float]) -> None
     ):
         raise RuntimeError("Worker globals have not been initialised yet.")
 
-    worker_param_manager.apply_variable_params(worker_core, scenario_params)
+    if scenario_params is None:
+        scenario_params = worker_scenario_values[scenario_idx]
+
+    with worker_core.Ecotracer.scenario_asserted():
+        worker_param_manager.apply_variable_params(worker_core, scenario_params)
     worker_core.Ecotracer.run()
     worker_result_manager.collect_results(scenario_idx)
 
@@ -114,5 +235,6 @@ def worker_clean_up() -> None:
     if worker_core is None or worker_model_path is None:
         raise RuntimeError("Worker globals have not been initialised yet.")
 
+    _release_batch()
     worker_core.close_model()
     os.remove(worker_model_path)
@@ -1,4 +1,6 @@
 from pyewe.exceptions import EcotracerNoScenarioError
+import gc
+import numpy as np
 import pytest
 from random import random, randint
 from warnings import warn
@@ -7,6 +9,8 @@ from math import isclose
 from pyewe import CoreInterface, EcotracerStateManager, EcosimStateManager
 from pyewe.exceptions import EwEError, EcopathError, EcosimError, EcotracerError
 from pyewe.exceptions import EcotracerNoScenarioError, EcosimNoScenarioError
+from pyewe.core.results_extraction import create_conc_extractor, SingleResultsExtractor
+from pyewe.core.results_extraction import DropEnum, _DROP_SLICES, get_drop_slice
 
 N_GROUPS = 16
 N_DETRITUS = 1
@@ -188,6 +192,39 @@ class TestScenarioAddRemove:
 
         core.close_model()
 
+    def test_ecosim_scenario_index_tracks_changes(self, tmp_model_path):
+        """The cached name to index map must follow added and removed scenarios."""
+
+        core = CoreInterface()
+        core.load_model(tmp_model_path)
+        internal_core = core.get_core()
+
+        def scenario_name(name):
+            index = core.Ecosim._scenario_index(name)
+            return internal_core.get_EcosimScenarios(index).Name
+
+        # Build the cache before changing the scenarios.
+        assert scenario_name("default_test") == "default_test"
+
+        core.Ecosim.new_scenario("index_a", "description", "author", "contact")
+        core.Ecosim.new_scenario("index_b", "description", "author", "contact")
+        assert scenario_name("index_a") == "index_a"
+        assert scenario_name("index_b") == "index_b"
+
+        # Removing a scenario shifts the index of those after it.
+        core.Ecosim.close_scenario()
+        core.Ecosim.remove_scenario("index_a")
+        assert scenario_name("index_b") == "index_b"
+        assert scenario_name("default_test") == "default_test"
+        with pytest.raises(LookupError):
+            core.Ecosim._scenario_index("index_a")
+
+        core.Ecosim.remove_scenario("index_b")
+        with pytest.raises(LookupError):
+            core.Ecosim._scenario_index("index_b")
+
+        core.close_model()
+
 
 class TestCoreProperties:
 
@@ -549,3 +586,88 @@ class TestEcotracerProperties:
         assert all(
             [isclose(exp, ret, rel_tol=1e-7) for (exp, ret) in zip(to_set, retrieved)]
         )
+
+
+class TestResultExtractorInvalidation:
+
+    def test_scenario_changes_invalidate_extractor(self, tmp_model_path):
+        """Loading a scenario or closing the model must drop the cached run state."""
+        core = CoreInterface()
+        core.load_model(tmp_model_path)
+        core.Ecosim.load_scenario("default_test")
+        core.Ecotracer.load_scenario("property_test")
+        core.Ecotracer.run()
+
+        extractor = create_conc_extractor(core.get_core(), core.get_state())
+        extractor.refresh_buffer()
+        assert extractor._warm
+        assert extractor._container is not None
+
+        core.Ecotracer.load_scenario("property_test")
+        assert not extractor._warm
+        assert extractor._container is None
+
+        core.Ecotracer.run()
+        extractor.refresh_buffer()
+        assert extractor._warm
+        assert extractor._container is not None
+
+        core.close_model()
+        assert not extractor._warm
+        assert extractor._container is None
+
+    def test_register_drops_collected_callbacks(self, tmp_model_path):
+        """Callbacks of collected extractors must not accumulate between changes."""
+        core = CoreInterface()
+        core.load_model(tmp_model_path)
+        state = core.get_state()
+
+        for _ in range(10):
+            create_conc_extractor(core.get_core(), state)
+            gc.collect()
+
+        kept = create_conc_extractor(core.get_core(), state)
+        assert len(state._scenario_callbacks) == 1
+        assert state._scenario_callbacks[0]() == kept.invalidate
+
+        core.close_model()
+
+
+class TestDropSlices:
+
+    @pytest.mark.parametrize(
+        "flag",
+        [
+            DropEnum.DROP_NONE,
+            DropEnum.DROP_FIRST,
+            DropEnum.DROP_LAST,
+            DropEnum.KEEP_LAST,
+        ],
+    )
+    def test_flags_and_index_expressions_agree(self, flag):
+        """Flags and their prebuilt index expressions must give the same index."""
+        assert get_drop_slice(flag) == _DROP_SLICES[flag]
+        assert get_drop_slice(_DROP_SLICES[flag]) == _DROP_SLICES[flag]
+
+    @pytest.mark.parametrize("flag", [4, -2, "first"])
+    def test_invalid_flag(self, flag):
+        with pytest.raises(ValueError):
+            get_drop_slice(flag)
+
+
+class TestResultExtractorCopy:
+
+    def test_reshaped_array_raises(self, mocker):
+        """A .NET array with the buffer's size but another shape must not be copied."""
+        net_arr = mocker.Mock(spec=["Rank", "Length", "GetLength"])
+        net_arr.Rank = 2
+        net_arr.Length = 6
+        net_arr.GetLength.side_effect = lambda dim: (3, 2)[dim]
+
+        extractor = SingleResultsExtractor.__new__(SingleResultsExtractor)
+        extractor._container = object()
+        extractor._array_getter = lambda container: net_arr
+        extractor._set_buffer(np.zeros((2, 3)))
+
+        with pytest.raises(RuntimeError, match="shape"):
+            extractor._copy_into_buffer()
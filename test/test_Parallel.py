@@ -1,9 +1,13 @@
 from pyewe.results.manager import construct_extraction_objects
+import gc
+import os
 import pytest
 import numpy as np
 import pandas as pd
+import xarray as xr
 
 from pyewe import EwEScenarioInterface
+from pyewe import worker
 
 from test.utils import (
     ECOTRACER_GROUP_INFO_PATH,
@@ -114,3 +118,167 @@ class TestParallelExecution:
             assert_arrays_close(expected1, produced1, context=f"{variable} scenario 1")
             assert_arrays_close(expected2, produced2, context=f"{variable} scenario 2")
         return None
+
+
+@pytest.fixture(scope="class")
+def batched_and_full_res(model_path):
+    """Run the same scenarios in batches and all at once."""
+    ewe_int = EwEScenarioInterface(model_path)
+
+    ewe_int.set_ecosim_group_info(pd.read_csv(ECOSIM_GROUP_INFO_PATH))
+    ewe_int.set_ecosim_vulnerabilities(pd.read_csv(VULNERABILITIES_PATH))
+    ewe_int.set_simulation_duration(75)
+
+    col_names, vals1 = construct_ecotracer_df(ewe_int, ECOTRACER_GROUP_INFO_PATH)
+    _, vals2 = construct_ecotracer_df(ewe_int, ECOTRACER_GROUP_INFO_PATH2)
+    scen_df = pd.DataFrame(np.tile([vals1, vals2], (4, 1))[:7], columns=col_names)
+    scen_df["scenario"] = np.arange(1, len(scen_df) + 1)
+
+    batches = list(ewe_int.run_scenarios_parallel_iter(scen_df, 2, batch_size=3))
+    full = ewe_int.run_scenarios_parallel(scen_df, 2)
+    yield batches, full
+
+    ewe_int.cleanup()
+
+
+class TestParallelBatches:
+
+    def test_batch_sizes(self, batched_and_full_res):
+        batches, _ = batched_and_full_res
+        assert [b.n_scenarios for b in batches] == [3, 3, 1]
+
+    def test_scenario_coordinates(self, batched_and_full_res):
+        batches, _ = batched_and_full_res
+        start = 0
+        for batch in batches:
+            coords = batch["Biomass"].coords["Scenario"].values
+            assert list(coords) == list(range(start, start + batch.n_scenarios))
+            assert list(batch.scenarios["scenario"]) == [c + 1 for c in coords]
+            start += batch.n_scenarios
+
+    @pytest.mark.parametrize(
+        "variable", ["Biomass", "Catch", "Mortality", "Concentration"]
+    )
+    def test_concatenated_batches_match_full_run(self, variable, batched_and_full_res):
+        batches, full = batched_and_full_res
+        combined = xr.concat([b[variable] for b in batches], dim="Scenario")
+
+        assert list(combined.coords["Scenario"].values) == list(
+            full[variable].coords["Scenario"].values
+        )
+        assert_arrays_close(
+            full[variable].values, combined.values, context=f"{variable} batches"
+        )
+
+
+@pytest.fixture(scope="class")
+def changed_columns_res(model_path):
+    """Run in parallel twice on one pool, the second run without any variable columns."""
+    ewe_int = EwEScenarioInterface(model_path)
+    ewe_int.set_ecosim_group_info(pd.read_csv(ECOSIM_GROUP_INFO_PATH))
+    ewe_int.set_ecosim_vulnerabilities(pd.read_csv(VULNERABILITIES_PATH))
+    ewe_int.set_simulation_duration(75)
+
+    # Default parameters, run before any variable parameters are written.
+    empty_df = ewe_int.get_empty_scenarios_df([], [], 8)
+    default_res = ewe_int.run_scenarios_parallel(empty_df, 4)
+
+    col_names, vals = construct_ecotracer_df(ewe_int, ECOTRACER_GROUP_INFO_PATH2)
+    varied_df = pd.DataFrame(np.tile(vals, (8, 1)), columns=col_names)
+    ewe_int.run_scenarios_parallel(varied_df, 4)
+
+    # The variable columns are dropped, workers must not keep the values from above.
+    after_res = ewe_int.run_scenarios_parallel(empty_df, 4)
+    yield default_res, after_res
+
+    ewe_int.cleanup()
+
+
+@pytest.fixture(scope="class")
+def dropped_column_res(model_path):
+    """Run in parallel twice on one pool, dropping a variable column in the second run."""
+    ewe_int = EwEScenarioInterface(model_path)
+    ewe_int.set_ecosim_group_info(pd.read_csv(ECOSIM_GROUP_INFO_PATH))
+    ewe_int.set_ecosim_vulnerabilities(pd.read_csv(VULNERABILITIES_PATH))
+    ewe_int.set_simulation_duration(75)
+
+    col_names, vals = construct_ecotracer_df(ewe_int, ECOTRACER_GROUP_INFO_PATH2)
+    env_idx = col_names.index("env_init_c")
+    subset_cols = col_names[:env_idx] + col_names[env_idx + 1 :]
+    subset_vals = vals[:env_idx] + vals[env_idx + 1 :]
+
+    # Reference: the subset of columns on a fresh pool.
+    subset_df = pd.DataFrame(np.tile(subset_vals, (8, 1)), columns=subset_cols)
+    reference_res = ewe_int.run_scenarios_parallel(subset_df, 4)
+
+    # Write env_init_c in every worker, then run the subset of columns again.
+    full_df = pd.DataFrame(np.tile(vals, (8, 1)), columns=col_names)
+    full_df["env_init_c"] = 5.0
+    ewe_int.run_scenarios_parallel(full_df, 4)
+    after_res = ewe_int.run_scenarios_parallel(subset_df, 4)
+    yield reference_res, after_res
+
+    ewe_int.cleanup()
+
+
+class TestParallelChangedColumns:
+
+    @pytest.mark.parametrize("variable", ["Biomass", "Concentration"])
+    def test_unset_params_return_to_defaults(self, variable, changed_columns_res):
+        default_res, after_res = changed_columns_res
+        assert_arrays_close(
+            default_res[variable].values,
+            after_res[variable].values,
+            context=f"{variable} after dropping all columns",
+        )
+
+    @pytest.mark.parametrize("variable", ["Biomass", "Concentration"])
+    def test_dropped_column_returns_to_default(self, variable, dropped_column_res):
+        reference_res, after_res = dropped_column_res
+        assert_arrays_close(
+            reference_res[variable].values,
+            after_res[variable].values,
+            context=f"{variable} after dropping env_init_c",
+        )
+
+
+def _worker_batch_state(_):
+    """Report the batch a pool worker is attached to."""
+    return worker.worker_batch_name, len(worker.worker_shared_buffers)
+
+
+def test_workers_release_batch(model_path):
+    """Workers must detach from a batch's shared buffers once the run returns."""
+    ewe_int = EwEScenarioInterface(model_path)
+    empty_df = ewe_int.get_empty_scenarios_df([], [], 8)
+    ewe_int.run_scenarios_parallel(empty_df, 2)
+
+    pool = ewe_int._pool_resources["pool"]
+    states = pool.map(_worker_batch_state, range(8), chunksize=1)
+    assert states == [(None, 0)] * 8
+
+    ewe_int.cleanup()
+
+
+def test_collected_interface_stops_pool(model_path):
+    """The finalizer must stop the worker pool and remove all model copies it made."""
+    ewe_int = EwEScenarioInterface(model_path)
+    empty_df = ewe_int.get_empty_scenarios_df([], [], 2)
+    ewe_int.run_scenarios_parallel(empty_df, 2)
+
+    pool_resources = ewe_int._pool_resources
+    processes = list(pool_resources["pool"]._pool)
+    snapshot_path = pool_resources["model_path"]
+    assert os.path.exists(snapshot_path)
+    worker_paths = [
+        worker.get_worker_model_path(snapshot_path, proc.pid) for proc in processes
+    ]
+    assert all(os.path.exists(path) for path in worker_paths)
+
+    del ewe_int
+    gc.collect()
+
+    assert pool_resources["pool"] is None
+    assert not any(proc.is_alive() for proc in processes)
+    assert not os.path.exists(snapshot_path)
+    assert not any(os.path.exists(path) for path in worker_paths)
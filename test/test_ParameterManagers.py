@@ -1,3 +1,5 @@
+import pickle
+import numpy as np
 import pytest
 from unittest.mock import Mock, call
 
@@ -174,6 +176,116 @@ class TestParameterManager:
             ecotracer_manager.params["env_init_c"].param_type == ParameterType.VARIABLE
         )
 
+    def test_reset(self, ecotracer_manager, mock_core_interface):
+        """Check reset unsets all parameters and clears applied constants"""
+        init_c_names = ecotracer_manager.get_fg_param_names("init_c")
+        ecotracer_manager.set_constant_params(init_c_names, [0] * len(init_c_names))
+        ecotracer_manager.set_variable_params(["env_init_c"], [1])
+
+        ecotracer_manager.reset()
+        assert set(ecotracer_manager.get_unset_params()) == set(
+            ecotracer_manager.get_all_param_names()
+        )
+
+        ecotracer_manager.apply_constant_params(mock_core_interface)
+        mock_core_interface.Ecotracer.set_initial_concentrations.assert_not_called()
+
+    def test_set_variable_params_unset_others(self, ecotracer_manager):
+        """Check unset_others drops variable parameters missing from the new columns"""
+        init_c_names = ecotracer_manager.get_fg_param_names("init_c")
+        ecotracer_manager.set_constant_params(["env_decay_r"], [0.5])
+        ecotracer_manager.set_variable_params(
+            init_c_names + ["env_init_c"], range(1, len(init_c_names) + 2)
+        )
+
+        ecotracer_manager.set_variable_params(
+            init_c_names, range(1, len(init_c_names) + 1), unset_others=True
+        )
+        assert ecotracer_manager.params["env_init_c"].param_type == ParameterType.UNSET
+        assert (
+            ecotracer_manager.params["env_decay_r"].param_type == ParameterType.CONSTANT
+        )
+        assert set(ecotracer_manager.get_set_params()) == set(init_c_names) | {
+            "env_decay_r"
+        }
+
+    def test_constant_variable_constant(self, ecotracer_manager, mock_core_interface):
+        """Check a parameter moves between the constant and variable tables cleanly"""
+        name = f"init_c_1_{FG_NAMES[0]}"
+        tracer = mock_core_interface.Ecotracer
+
+        ecotracer_manager.set_constant_params([name], [0.5])
+        ecotracer_manager.apply_constant_params(mock_core_interface)
+        tracer.set_initial_concentrations.assert_called_once_with([0.5], [1])
+
+        tracer.reset_mock()
+        ecotracer_manager.set_variable_params([name], [1])
+        assert ecotracer_manager.params[name].param_type == ParameterType.VARIABLE
+        ecotracer_manager.apply_constant_params(mock_core_interface)
+        tracer.set_initial_concentrations.assert_not_called()
+        ecotracer_manager.apply_variable_params(mock_core_interface, [0, 2.0])
+        tracer.set_initial_concentrations.assert_called_once_with([2.0], [1])
+
+        tracer.reset_mock()
+        ecotracer_manager.set_constant_params([name], [0.7])
+        assert ecotracer_manager.params[name].param_type == ParameterType.CONSTANT
+        ecotracer_manager.apply_variable_params(mock_core_interface, [0, 2.0])
+        tracer.set_initial_concentrations.assert_not_called()
+        ecotracer_manager.apply_constant_params(mock_core_interface)
+        tracer.set_initial_concentrations.assert_called_once_with([0.7], [1])
+
+    def test_set_same_variable_params_twice(
+        self, mocker, ecotracer_manager, mock_core_interface
+    ):
+        """Check setting the same columns again keeps the prepared tables and setters"""
+        names = [f"init_c_1_{FG_NAMES[0]}", f"immig_c_2_{FG_NAMES[1]}"]
+        ecotracer_manager.set_variable_params(names, [1, 2])
+        ecotracer_manager.apply_variable_params(mock_core_interface, [0, 1.0, 2.0])
+        buffers = ecotracer_manager._variable_fg_buffers
+
+        process_spy = mocker.spy(ecotracer_manager, "_process_variable_params")
+        ecotracer_manager.set_variable_params(names, [1, 2])
+        process_spy.assert_not_called()
+        assert ecotracer_manager._variable_fg_buffers is buffers
+        assert ecotracer_manager._bound_core is mock_core_interface
+
+        ecotracer_manager.apply_variable_params(mock_core_interface, [0, 3.0, 4.0])
+        tracer = mock_core_interface.Ecotracer
+        tracer.set_initial_concentrations.assert_called_with([3.0], [1])
+        tracer.set_immigration_concentrations.assert_called_with([4.0], [2])
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float16, np.int64, np.bool_])
+    def test_apply_variable_params_dtypes(
+        self, dtype, ecotracer_manager, mock_core_interface
+    ):
+        """Check scenario rows of any numeric dtype are written as floats"""
+        ecotracer_manager.set_variable_params([f"init_c_1_{FG_NAMES[0]}"], [1])
+        ecotracer_manager.apply_variable_params(
+            mock_core_interface, np.array([0, 1], dtype=dtype)
+        )
+
+        setter = mock_core_interface.Ecotracer.set_initial_concentrations
+        setter.assert_called_once_with([1.0], [1])
+        assert isinstance(setter.call_args.args[0][0], float)
+
+    def test_pickle_and_bind_core(self, ecotracer_manager, mock_core_interface):
+        """Check a manager sent to a worker can be bound to and applied on a new core"""
+        ecotracer_manager.set_constant_params([f"init_c_1_{FG_NAMES[0]}"], [0.5])
+        ecotracer_manager.set_variable_params([f"immig_c_2_{FG_NAMES[1]}"], [1])
+        ecotracer_manager.bind_core(mock_core_interface)
+
+        restored = pickle.loads(pickle.dumps(ecotracer_manager))
+        assert restored._bound_core is None
+        assert restored._constant_bound_core is None
+
+        restored.bind_core(mock_core_interface)
+        restored.apply_constant_params(mock_core_interface)
+        restored.apply_variable_params(mock_core_interface, [0, 2.0])
+
+        tracer = mock_core_interface.Ecotracer
+        tracer.set_initial_concentrations.assert_called_once_with([0.5], [1])
+        tracer.set_immigration_concentrations.assert_called_once_with([2.0], [2])
+
     def test_apply_constant_params(self, ecotracer_manager, mock_core_interface):
         """Check apply constant params calls the correct setter functions"""
         const_param_names = [
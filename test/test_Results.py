@@ -0,0 +1,103 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+from unittest.mock import Mock
+
+from pyewe.results.results_set import (
+    _ZARR_CHUNK_BYTES,
+    ResultSet,
+    _choose_chunks,
+    write_csv,
+)
+
+
+class TestChooseChunks:
+
+    @pytest.mark.parametrize(
+        "shape",
+        [
+            (0,),
+            (0, 5, 10),
+            (4, 0, 10),
+            (4, 5, 0),
+            (1,),
+            (1, 1, 1),
+            (1, 5, 1),
+            (7, 1, 600),
+        ],
+    )
+    def test_chunks_within_shape(self, shape):
+        """Chunks must be at least one and no larger than any non-empty dimension."""
+        chunks = _choose_chunks(shape, 8)
+        assert len(chunks) == len(shape)
+        for c, n in zip(chunks, shape):
+            assert c >= 1
+            assert c <= max(n, 1)
+
+    def test_single_scenario(self):
+        assert _choose_chunks((1, 5, 10), 8) == (1, 5, 10)
+
+    def test_long_time_axis_is_split(self):
+        """A scenario larger than the target is split along time in powers of two."""
+        chunks = _choose_chunks((3, 1, 2**20), 8, target_bytes=2**20)
+        assert chunks == (1, 1, 2**17)
+
+    def test_scenarios_grouped_within_target(self):
+        chunks = _choose_chunks((100, 4, 8), 8, target_bytes=4 * 8 * 8 * 16)
+        assert chunks == (16, 4, 8)
+
+
+class TestWriteCsv:
+
+    def test_matches_pandas(self, tmp_path):
+        """The polars writer must produce the same file as pandas' to_csv."""
+        df = pd.DataFrame(
+            {
+                "Scenario": np.array([0, 0, 1, 1], dtype=np.int64),
+                "Group": ["Large pelagics", "Detritus", "Large pelagics", "Detritus"],
+                "Biomass": np.array([0.5, np.nan, 1.25, 3.0], dtype=np.float64),
+                "Catch": np.array([2.0, 0.25, np.nan, 0.0], dtype=np.float32),
+            }
+        )
+        polars_path = tmp_path / "polars.csv"
+        pandas_path = tmp_path / "pandas.csv"
+        write_csv(df, str(polars_path))
+        df.to_csv(pandas_path, index=False)
+
+        polars_text = polars_path.read_text()
+        assert polars_text == pandas_path.read_text()
+        # Missing values are written as empty fields.
+        assert "0,Detritus,,0.25" in polars_text.splitlines()
+
+
+class TestWriteZarr:
+
+    def test_round_trip(self, tmp_path):
+        """Variables written to zarr must read back with the same values and dtype."""
+        pytest.importorskip("zarr.codecs")
+
+        values = np.arange(3 * 4 * 10, dtype=np.float32).reshape(3, 4, 10)
+        values[0, 1, 2] = np.nan
+        biomass = xr.DataArray(
+            values,
+            dims=["Scenario", "Group", "Time"],
+            coords={"Scenario": [0, 1, 2]},
+            attrs={"name": "Biomass"},
+        )
+        py_core = Mock(spec=["get_country", "get_first_year"])
+        result_set = ResultSet(
+            py_core, pd.DataFrame({"scenario": [0, 1, 2]}), {"Biomass": biomass}
+        )
+
+        result_set.save_results(str(tmp_path), ["zarr"])
+        with xr.open_zarr(os.path.join(tmp_path, "Biomass.zarr")) as ds:
+            read = ds["Biomass"]
+            assert read.dtype == np.float32
+            assert read.dims == biomass.dims
+            np.testing.assert_array_equal(read.values, values)
+            np.testing.assert_array_equal(read["Scenario"].values, [0, 1, 2])
+            assert read.encoding["chunks"] == _choose_chunks(
+                values.shape, values.itemsize, _ZARR_CHUNK_BYTES
+            )
@@ -1,10 +1,11 @@
+import os
 import pytest
 import pandas as pd
 import numpy as np
 from io import StringIO
 from math import isclose
 
-from pyewe import EwEScenarioInterface
+from pyewe import CoreInterface, EwEScenarioInterface
 
 from .utils import (
     ECOTRACER_GROUP_INFO_PATH,
@@ -236,3 +237,55 @@ class TestFormatParamNames:
         # Outputs
         returned = scenario_interface.format_param_names(full_p_names, fg_names)
         assert all([ret == ex for (ret, ex) in zip(returned, expected)])
+
+
+@pytest.fixture(scope="function")
+def readonly_interface(tmp_model_path):
+    """Open the model in place as a read-only interface."""
+    core = CoreInterface()
+    core.load_model(tmp_model_path)
+    n_scenarios = (core._core.nEcosimScenarios, core._core.nEcotracerScenarios)
+    core.close_model()
+
+    ewe_int = EwEScenarioInterface(tmp_model_path, readonly=True)
+    yield ewe_int, n_scenarios
+
+    ewe_int.cleanup()
+
+
+class TestReadonlyInterface:
+
+    def test_model_is_not_copied(self, readonly_interface, tmp_model_path):
+        ewe_int, _ = readonly_interface
+        assert ewe_int._temp_model_path == tmp_model_path
+        assert ewe_int._temp_dir is None
+
+    def test_no_scenarios_created(self, readonly_interface):
+        ewe_int, n_scenarios = readonly_interface
+        internal_core = ewe_int._core_instance.get_core()
+        assert (
+            internal_core.nEcosimScenarios,
+            internal_core.nEcotracerScenarios,
+        ) == n_scenarios
+
+    def test_writers_raise(self, readonly_interface):
+        ewe_int, _ = readonly_interface
+        with pytest.raises(RuntimeError, match="read-only"):
+            ewe_int.set_simulation_duration(10)
+        with pytest.raises(RuntimeError, match="read-only"):
+            ewe_int.set_constant_params(["env_init_c"], [1.0])
+        with pytest.raises(RuntimeError, match="read-only"):
+            ewe_int.reset_parameters()
+        with pytest.raises(RuntimeError, match="read-only"):
+            ewe_int.set_ecosim_group_info(pd.read_csv(ECOSIM_GROUP_INFO_PATH))
+
+        scenarios = ewe_int.get_empty_scenarios_df([], [], 1)
+        with pytest.raises(RuntimeError, match="read-only"):
+            ewe_int.run_scenarios(scenarios)
+        with pytest.raises(RuntimeError, match="read-only"):
+            ewe_int.run_scenarios_parallel(scenarios, 1)
+
+    def test_cleanup_keeps_model(self, tmp_model_path):
+        ewe_int = EwEScenarioInterface(tmp_model_path, readonly=True)
+        ewe_int.cleanup()
+        assert os.path.exists(tmp_model_path)